@@ -24,40 +24,39 @@ from .providers.provider_info import ProviderInfo
 from .providers.server_info import ServerInfo
 from .utils.rates import DataRateMbps, Percentage, TimeDuration
 
-# Dynamic version import
+# Dynamic version import, deferred to first access by __getattr__ below
 __version__: str
-try:
-    from importlib.metadata import version as _version
 
-    __version__ = _version("netvelocimeter")
-except (ImportError, ModuleNotFoundError):
-    # Fallback for development environments where the library package itself is not installed
-    __version__ = "0.9.8.dev7+654321abcdef"
 
+def __getattr__(name: str) -> str:
+    """Get the library version on first access of `__version__`.
 
-# Dynamically import all provider modules which leads to them being registered
-def _import_providers() -> None:
-    """Import all provider modules from the providers directory."""
-    import importlib
-    import pathlib
-    import pkgutil
+    Reading the installed package metadata imports importlib.metadata, which is one of the slowest
+    imports of the package and is not needed by most CLI commands. The version is cached as a
+    module global so later accesses do not call this function.
 
-    # Get the path to the current directory
-    providers_dir = pathlib.Path(__file__).parent / "providers"
+    Args:
+        name: Name of the module attribute
 
-    # Import all Python files in this directory
-    for module_info in pkgutil.iter_modules([str(providers_dir)]):
-        # Skip __init__ and base modules
-        if module_info.name not in ["__init__", "base"]:
-            # Import the provider module
-            importlib.import_module(f".{module_info.name}", package="netvelocimeter.providers")
+    Returns:
+        The library version string
 
+    Raises:
+        AttributeError: If the attribute is not `__version__`
+    """
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Run dynamic imports
-_import_providers()
+    global __version__
+    try:
+        from importlib.metadata import version as _version
+
+        __version__ = _version("netvelocimeter")
+    except (ImportError, ModuleNotFoundError):
+        # Fallback for development environments where the library package itself is not installed
+        __version__ = "0.9.8.dev7+654321abcdef"
+    return __version__
 
-# Clean namespace
-del _import_providers
 
 # module names that are exposed to wildcard imports `from netvelocimeter import *`
 __all__ = [
@@ -7,7 +7,7 @@ from typing import Annotated
 from click import Choice
 import typer
 
-from .. import __version__ as version_string, list_providers
+from .. import list_providers
 from ..utils.xdg import XDGCategory
 from .utils.logger import setup_cli_logging
 from .utils.output_format import OutputFormat
@@ -181,6 +181,9 @@ def global_options(
     setup_cli_logging(log_level=log_level)
 
     if version:
+        # Import on demand, reading the package version is deferred until needed
+        from .. import __version__ as version_string
+
         typer.echo(f"NetVelocimeter {version_string}")
         # quick exit with no error
         raise typer.Exit()
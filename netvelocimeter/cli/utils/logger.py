@@ -3,8 +3,35 @@
 import logging
 import os
 import sys
+import threading
 import time
 
+# Get the package root logger and build the CLI log formatter once, reused by every setup
+_root_logger = logging.getLogger("netvelocimeter")
+_cli_formatter = logging.Formatter(
+    fmt="%(asctime)s.%(msecs)03dZ [%(levelname)s] %(name)s: %(message)s",
+    datefmt="%Y-%m-%dT%H:%M:%S",
+)
+# Convert timestamps to UTC
+_cli_formatter.converter = time.gmtime
+
+# Console handler installed by setup_cli_logging, reused while it writes to the current stderr
+_cli_handler: logging.StreamHandler | None = None
+_cli_handler_lock = threading.Lock()
+
+
+def _cli_handler_installed() -> bool:
+    """Check whether the console handler is the only handler and writes to the current stderr.
+
+    Returns:
+        True if the installed console handler can be reused.
+    """
+    return (
+        _cli_handler is not None
+        and _root_logger.handlers == [_cli_handler]
+        and _cli_handler.stream is sys.stderr
+    )
+
 
 def setup_cli_logging(
     log_level: int | None = None,
@@ -19,22 +46,21 @@ def setup_cli_logging(
     Args:
         log_level: Numeric log level override (logging.DEBUG, logging.INFO, etc.)
     """
-    # get root logger
-    root_logger = logging.getLogger("netvelocimeter")
-
-    # Add console handler
-    handler = logging.StreamHandler(sys.stderr)
-    formatter = logging.Formatter(
-        fmt="%(asctime)s.%(msecs)03dZ [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%dT%H:%M:%S",
-    )
-    # Convert timestamps to UTC
-    formatter.converter = time.gmtime
-    handler.setFormatter(formatter)
+    global _cli_handler
+
+    # Repeated setup reuses the console handler unless handlers or stderr were changed.
+    # Check without the lock for the common case, then again with it so concurrent setups
+    # install exactly one handler.
+    if not _cli_handler_installed():
+        with _cli_handler_lock:
+            if not _cli_handler_installed():
+                # Add console handler
+                _cli_handler = logging.StreamHandler(sys.stderr)
+                _cli_handler.setFormatter(_cli_formatter)
 
-    # remove existing handlers and add the new one
-    root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+                # remove existing handlers and add the new one
+                _root_logger.handlers.clear()
+                _root_logger.addHandler(_cli_handler)
 
     # Set root log level based on parameter, env var, or default
     if log_level is None:
@@ -44,13 +70,13 @@ def setup_cli_logging(
             try:
                 log_level = getattr(logging, env_level_name)
             except AttributeError:
-                root_logger.error(
+                _root_logger.error(
                     f"Invalid NETVELOCIMETER_LOG_LEVEL '{env_level_name}', using ERROR."
                 )
 
     # Set level on root logger, defaulting to ERROR if not specified
     log_level = log_level or logging.ERROR
-    root_logger.setLevel(log_level)
+    _root_logger.setLevel(log_level)
 
     # Limit traceback display to show only on debug and more verbose levels
     if log_level > logging.DEBUG:
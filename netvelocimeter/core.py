@@ -21,6 +21,13 @@ from .providers.server_info import ServerIDType, ServerInfo
 # Map of provider names to provider classes
 _PROVIDERS: dict[str, type[BaseProvider]] = {}
 
+# Description lines parsed from provider class docstrings. Docstrings do not change after class
+# creation so entries are never invalidated.
+_DESCRIPTION_CACHE: dict[type[BaseProvider], tuple[str, ...]] = {}
+
+# Whether the built-in provider modules have been imported and therefore registered
+_discovered = False
+
 # Get logger
 logger = logging.getLogger(__name__)
 
@@ -47,6 +54,43 @@ def _normalize_provider_name(name: str) -> str:
     return name
 
 
+def _discover_providers() -> None:
+    """Import all provider modules from the providers directory, which registers them."""
+    import importlib
+    import pathlib
+    import pkgutil
+
+    # Get the path to the providers directory
+    providers_dir = pathlib.Path(__file__).parent / "providers"
+
+    # Import all Python files in this directory
+    for module_info in pkgutil.iter_modules([str(providers_dir)]):
+        # Skip __init__ and base modules
+        if module_info.name not in ["__init__", "base"]:
+            # Import the provider module
+            importlib.import_module(f".{module_info.name}", package="netvelocimeter.providers")
+
+
+def _ensure_discovered() -> None:
+    """Discover the built-in providers on first use of the provider registry.
+
+    Discovery imports every provider module and their dependencies. Deferring it to the first
+    registration or lookup keeps that cost out of `import netvelocimeter`. Built-in providers
+    are always registered before any other provider, so a clashing name is reported when that
+    other provider is registered.
+    """
+    global _discovered
+    if not _discovered:
+        # Set first so registrations and lookups made by provider modules do not rerun discovery
+        _discovered = True
+        try:
+            _discover_providers()
+        except BaseException:
+            # allow a later use of the registry to retry discovery
+            _discovered = False
+            raise
+
+
 def register_provider(name: str, provider_class: type[B]) -> None:
     """Register a provider class with the library.
 
@@ -57,6 +101,8 @@ def register_provider(name: str, provider_class: type[B]) -> None:
         name: Name to register the provider under
         provider_class: Provider class to register
     """
+    _ensure_discovered()
+
     # validate provider_class
     if not issubclass(provider_class, BaseProvider) or inspect.isabstract(provider_class):
         raise ValueError(
@@ -93,11 +139,14 @@ def get_provider(name: str) -> type[BaseProvider]:
         ProviderClass = get_provider("ookla")
         custom_provider = ProviderClass(custom_option=True)
     """
-    # Normalize name and retrieve provider class
-    name = _normalize_provider_name(name)
+    _ensure_discovered()
+
+    # Registered names are normalized so a lowercase lookup finds any valid, registered name.
+    # Full validation is only needed to report why a lookup failed.
     try:
-        return _PROVIDERS[name]
+        return _PROVIDERS[name.lower()]
     except KeyError as e:
+        name = _normalize_provider_name(name)
         raise ValueError(
             f"Provider '{name}' not found. Available providers: {', '.join(_PROVIDERS.keys())}"
         ) from e
@@ -114,19 +163,34 @@ def list_providers() -> list[ProviderInfo]:
         [ProviderInfo(name='ookla', description='Ookla Speedtest provider'),
         ProviderInfo(name='static', description='Static provider for testing')]
     """
+    _ensure_discovered()
     return [
-        ProviderInfo(
-            name=name,
-            description=[
-                stripped_line
-                for line in provider.__doc__.splitlines()  # type: ignore[union-attr]
-                if (stripped_line := line.strip())
-            ],
-        )
+        ProviderInfo(name=name, description=list(_provider_description(provider)))
         for name, provider in _PROVIDERS.items()
     ]
 
 
+def _provider_description(provider_class: type[BaseProvider]) -> tuple[str, ...]:
+    """Get the description of a provider class from its docstring.
+
+    Args:
+        provider_class: Provider class, which must have a docstring
+
+    Returns:
+        The non-empty lines of the docstring with surrounding whitespace removed
+    """
+    try:
+        return _DESCRIPTION_CACHE[provider_class]
+    except KeyError:
+        description = tuple(
+            stripped_line
+            for line in provider_class.__doc__.splitlines()  # type: ignore[union-attr]
+            if (stripped_line := line.strip())
+        )
+        _DESCRIPTION_CACHE[provider_class] = description
+        return description
+
+
 def library_version() -> Version:
     """Get the version of the NetVelocimeter library as a Version object.
 
@@ -173,7 +173,8 @@ class LegalTerms(TwoColumnFormatMixin):
         content = f"{self.text or ''}|{self.url or ''}|{self.category.value}"
 
         # construct a unique identifier
-        return f"1/{hash_b64encode(content)}"
+        # sha256 is pinned to keep ids of persisted acceptances stable
+        return f"1/{hash_b64encode(content, algorithm='sha256')}"
 
 
 # Type alias for a collection of LegalTerms
@@ -171,6 +171,7 @@ class OoklaProvider(BaseProvider):
             url=binary_meta.url,
             internal_filepath=binary_meta.internal_filepath,
             hash_sha256=binary_meta.hash_sha256,
+            mirror_urls=binary_meta.mirror_urls,
         )
 
         # then set version derived from the binary
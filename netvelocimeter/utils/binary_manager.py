@@ -1,5 +1,7 @@
 """Utilities for managing binary downloads and execution."""
 
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 import hashlib
 import inspect
@@ -7,21 +9,32 @@ import logging
 import os
 import platform
 import stat
-import tarfile
+import sys
 from tempfile import TemporaryDirectory
-from typing import TypeVar
+from typing import TYPE_CHECKING, BinaryIO, TypeVar
 from urllib.parse import urlsplit
-import urllib.request
-import zipfile
 
 from ..exceptions import PlatformNotSupported
 from ..providers.base import BaseProvider
 from .hash import hash_b64encode
 from .xdg import XDGCategory
 
+if TYPE_CHECKING:
+    import http.client
+    import tarfile
+
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Chunk size for streaming downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Mode of extracted executables; matches the mode of the binary cache directories
+_EXECUTABLE_MODE = 0o750
+
+# Minimum file size to split into parallel range downloads; smaller files download sequentially
+_PARALLEL_MIN_SIZE = 8 * 1024 * 1024
+
 
 @dataclass(frozen=True)
 class BinaryMeta:
@@ -34,11 +47,14 @@ class BinaryMeta:
         url: url from which to download the archive containing the binary
         internal_filepath: internal file path of binary within archive
         hash_sha256: SHA-256 hash of the archive for verification
+        mirror_urls: optional mirror urls serving the identical archive, used to
+            download byte ranges of the archive in parallel
     """
 
     url: str
     internal_filepath: str
     hash_sha256: str
+    mirror_urls: tuple[str, ...] = ()
 
 
 def select_platform_binary(
@@ -108,27 +124,223 @@ def verified_basename(filepath: str) -> str:
     return basename
 
 
+def _canonical_path(path: str) -> str:
+    """Expand environment variables and user directory, then make absolute and normalized.
+
+    Args:
+        path: Path to canonicalize, e.g. "~/file.zip", "${HOME}/file.zip", "relative/file.zip".
+
+    Returns:
+        Absolute and normalized path.
+    """
+    return os.path.abspath(os.path.expanduser(os.path.expandvars(path)))
+
+
+@contextmanager
+def _exclusive_lock(lock_filepath: str) -> Iterator[None]:
+    """Hold an exclusive lock on a file, waiting while another process or thread holds it.
+
+    The lock file is created if needed and never removed. The operating system releases
+    the lock when the process exits, so a crashed holder does not block later callers.
+
+    Args:
+        lock_filepath: Path of the lock file.
+    """
+    with open(lock_filepath, "a+b") as lock_file:
+        if sys.platform == "win32":
+            import msvcrt
+
+            # lock the first byte, each attempt of LK_LOCK waits about 10 seconds
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _copy_response(response: "http.client.HTTPResponse", out_file: BinaryIO) -> None:
+    """Copy the body of a url response to a file.
+
+    On Linux, plain http responses with a known length are spliced from the socket to
+    the file inside the kernel through a pipe, avoiding userspace copies. TLS and chunked
+    responses, and other platforms, copy in chunks through userspace.
+
+    Args:
+        response: Response returned by `urllib.request.urlopen()`.
+        out_file: File opened for binary writing at the offset to write the body.
+
+    Raises:
+        RuntimeError: If the connection closes before the whole body is received.
+    """
+    import http.client
+    import socket
+
+    # locate the plain socket of the response, decrypted TLS data is not on a socket fd
+    sock = None
+    if (
+        hasattr(os, "splice")
+        and isinstance(response, http.client.HTTPResponse)
+        and response.geturl().startswith("http://")
+        and not response.chunked
+        and response.length
+    ):
+        sock = getattr(getattr(response.fp, "raw", None), "_sock", None)
+    if not isinstance(sock, socket.socket) or sock.gettimeout() is not None:
+        import shutil
+
+        shutil.copyfileobj(response, out_file, _DOWNLOAD_CHUNK_SIZE)
+        return
+
+    # bytes already read from the socket into the response buffer are written normally
+    remaining = response.length or 0
+    buffered = response.read(min(len(response.fp.peek()), remaining))
+    out_file.write(buffered)
+    out_file.flush()
+
+    # splice the remainder socket -> pipe -> file
+    remaining -= len(buffered)
+    read_fd, write_fd = os.pipe()
+    try:
+        while remaining:
+            count = os.splice(sock.fileno(), write_fd, min(remaining, _DOWNLOAD_CHUNK_SIZE))
+            if not count:
+                raise RuntimeError(f"Connection closed with {remaining} bytes remaining")
+            remaining -= count
+            while count:
+                count -= os.splice(read_fd, out_file.fileno(), count)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+    response.length = 0
+
+    # resync the file object with the file offset advanced by the kernel
+    out_file.seek(os.lseek(out_file.fileno(), 0, os.SEEK_CUR))
+
+
+def _strong_validator(headers: "http.client.HTTPMessage") -> str | None:
+    """Get a validator of a response usable in a later If-Range request.
+
+    Args:
+        headers: Headers of the response.
+
+    Returns:
+        The strong ETag, else the Last-Modified date, else None.
+    """
+    # weak ETags can not be used with If-Range
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
 def download_file(url: str, dest_filepath: str) -> str:
     r"""Download a URL into a local destination path+filename.
 
+    The response is streamed in chunks into a `.part` file which is renamed to the
+    destination when complete. The response's validator (ETag or Last-Modified) is saved
+    beside it in a `.part.validator` file. If both remain from an interrupted download,
+    the download resumes with an HTTP range request conditional on the validator.
+    The download restarts from the beginning when the file changed on the server,
+    the server does not support range requests, or it sends a different range.
+
     Args:
         url: URL from which to download the file.
         dest_filepath: Local destination path+filename for the downloaded file,
             e.g. "/path/to/file.zip", "C:\path\to\file.zip", "~/path/to/file.zip".
+
+    Returns:
+        Absolute path to the downloaded file.
     """
     # assert a valid basename
     verified_basename(dest_filepath)
 
     # construct the absolute path for the destination file
     # caution: will change relative paths to absolute paths from the current working directory
-    absolute_filepath = os.path.abspath(os.path.expanduser(dest_filepath))
+    absolute_filepath = _canonical_path(dest_filepath)
+    partial_filepath = absolute_filepath + ".part"
+    validator_filepath = partial_filepath + ".validator"
 
     # create hierarchy of directories
     os.makedirs(os.path.dirname(absolute_filepath), mode=0o750, exist_ok=True)
 
-    # open the URL and write the response to the file
-    with urllib.request.urlopen(url) as response, open(absolute_filepath, "wb") as out_file:
-        out_file.write(response.read())
+    from http import HTTPStatus
+    import urllib.error
+    import urllib.request
+
+    # an interrupted download is only resumed when its validator can detect a changed file
+    offset = 0
+    validator = ""
+    if os.path.exists(partial_filepath) and os.path.exists(validator_filepath):
+        with open(validator_filepath, encoding="utf-8") as f:
+            validator = f.read()
+        if validator:
+            offset = os.path.getsize(partial_filepath)
+
+    while True:
+        # resume an interrupted download by requesting only the missing bytes
+        request = urllib.request.Request(url)
+        if offset:
+            request.add_header("Range", f"bytes={offset}-")
+            request.add_header("If-Range", validator)
+            logger.info(f"Resuming download of {url} at byte {offset}")
+
+        # open the URL and stream the response to the file
+        try:
+            with urllib.request.urlopen(request) as response:
+                if offset and response.status == HTTPStatus.PARTIAL_CONTENT:
+                    # a range other than the one requested can not be appended
+                    content_range = response.headers.get("Content-Range") or ""
+                    if not content_range.startswith(f"bytes {offset}-"):
+                        logger.info(f"Restarting download of {url}, received {content_range}")
+                        offset = 0
+                        continue
+                else:
+                    # a new download, or the server is sending the whole (possibly changed) file
+                    offset = 0
+                    validator = _strong_validator(response.headers) or ""
+                    if validator:
+                        with open(validator_filepath, "w", encoding="utf-8") as f:
+                            f.write(validator)
+                    elif os.path.exists(validator_filepath):
+                        os.remove(validator_filepath)
+
+                # not opened in append mode, os.splice() rejects files opened with O_APPEND
+                with open(partial_filepath, "r+b" if offset else "wb") as out_file:
+                    out_file.seek(offset)
+                    _copy_response(response, out_file)
+        except urllib.error.HTTPError as e:
+            if not offset or e.code != HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                raise
+            e.close()
+
+            # no bytes remain after the offset; the partial file is complete if it has the
+            # file's size, otherwise the file changed and the download restarts
+            content_range = e.headers.get("Content-Range") or ""
+            if content_range != f"bytes */{offset}":
+                logger.info(f"Restarting download of {url}, received {content_range}")
+                offset = 0
+                continue
+        break
+
+    # atomically move the completed download to its final name
+    os.replace(partial_filepath, absolute_filepath)
+    if os.path.exists(validator_filepath):
+        os.remove(validator_filepath)
 
     # ensure the downloaded file exists
     if not os.path.exists(absolute_filepath):
@@ -136,24 +348,177 @@ def download_file(url: str, dest_filepath: str) -> str:
     return absolute_filepath
 
 
-def ensure_executable(filepath: str) -> str:
+def _download_range(urls: Sequence[str], filepath: str, start: int, end: int) -> None:
+    """Download the inclusive byte range start->end of a URL into the same offsets of a file.
+
+    Each URL is tried in order until one of them downloads the complete range.
+
+    Args:
+        urls: URLs serving identical content from which to download the byte range.
+        filepath: Existing file, already sized, into which the byte range is written.
+        start: First byte offset of the range.
+        end: Last byte offset of the range (inclusive).
+
+    Raises:
+        OSError: If the last URL fails with a network or file error.
+        RuntimeError: If the last URL does not honor the range request or sends the wrong length.
+    """
+    from http import HTTPStatus
+    import urllib.request
+
+    for i, url in enumerate(urls):
+        try:
+            request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+            with urllib.request.urlopen(request) as response, open(filepath, "r+b") as out_file:
+                if response.status != HTTPStatus.PARTIAL_CONTENT:
+                    raise RuntimeError(f"Range request not supported by {url}")
+                out_file.seek(start)
+                _copy_response(response, out_file)
+                if out_file.tell() != end + 1:
+                    raise RuntimeError(f"Incomplete range {start}-{end} downloaded from {url}")
+            return
+        except (OSError, RuntimeError) as e:
+            if i == len(urls) - 1:
+                raise
+            logger.info(f"Retrying range {start}-{end} from {urls[i + 1]}, {url} failed: {e}")
+
+
+def download_file_parallel(urls: Sequence[str], dest_filepath: str, parts: int = 4) -> str:
+    r"""Download a file as parallel byte ranges spread across mirror URLs.
+
+    All URLs must serve identical content; ranges are assigned to URLs round-robin
+    and a range which fails is retried from the other URLs. The file size is queried
+    with a HEAD request to the first URL. When that request fails, the size is unknown,
+    the server does not accept byte ranges, the file is small, or a range can not be
+    downloaded from any URL, this falls back to a sequential `download_file()` of the
+    first URL.
+
+    Args:
+        urls: URLs serving identical content, e.g. a primary url followed by mirrors.
+        dest_filepath: Local destination path+filename for the downloaded file,
+            e.g. "/path/to/file.zip", "C:\path\to\file.zip", "~/path/to/file.zip".
+        parts: Number of byte ranges to download concurrently.
+
+    Returns:
+        Absolute path to the downloaded file.
+
+    Raises:
+        ValueError: If no URLs are provided.
+    """
+    if not urls:
+        raise ValueError("At least one URL is required.")
+
+    # assert a valid basename
+    verified_basename(dest_filepath)
+
+    import urllib.request
+
+    # query size and range support, e.g. servers may reject HEAD with 403 or 405
+    try:
+        with urllib.request.urlopen(urllib.request.Request(urls[0], method="HEAD")) as response:
+            size = int(response.headers.get("Content-Length") or 0)
+            accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+    except OSError as e:
+        logger.warning(f"Downloading {urls[0]} sequentially, HEAD request failed: {e}")
+        return download_file(url=urls[0], dest_filepath=dest_filepath)
+    if parts < 2 or not accepts_ranges or size < _PARALLEL_MIN_SIZE:
+        return download_file(url=urls[0], dest_filepath=dest_filepath)
+
+    # construct the absolute path for the destination file and create hierarchy of directories
+    absolute_filepath = _canonical_path(dest_filepath)
+    partial_filepath = absolute_filepath + ".part"
+    os.makedirs(os.path.dirname(absolute_filepath), mode=0o750, exist_ok=True)
+
+    # split into inclusive byte ranges
+    range_size = -(-size // parts)  # ceiling division
+    ranges = [(start, min(start + range_size, size) - 1) for start in range(0, size, range_size)]
+    logger.info(f"Downloading {len(ranges)} ranges of {urls[0]} from {len(urls)} sources")
+
+    # a sparse partial file can not be resumed by download_file(), so remove its validator
+    validator_filepath = partial_filepath + ".validator"
+    if os.path.exists(validator_filepath):
+        os.remove(validator_filepath)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        # preallocate the file so each range is written at its own offset
+        with open(partial_filepath, "wb") as out_file:
+            out_file.truncate(size)
+
+        # download ranges concurrently, each starting at its round-robin URL then trying the
+        # others; consuming results re-raises the first failure
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(
+                    _download_range,
+                    [*urls[i % len(urls) :], *urls[: i % len(urls)]],
+                    partial_filepath,
+                    start,
+                    end,
+                )
+                for i, (start, end) in enumerate(ranges)
+            ]
+            for future in futures:
+                future.result()
+    except BaseException as e:
+        # a sparse partial file can not be resumed by download_file(), so remove it
+        if os.path.exists(partial_filepath):
+            os.remove(partial_filepath)
+        if not isinstance(e, Exception):
+            raise
+        logger.warning(f"Downloading {urls[0]} sequentially, parallel download failed: {e}")
+        return download_file(url=urls[0], dest_filepath=dest_filepath)
+
+    # atomically move the completed download to its final name
+    os.replace(partial_filepath, absolute_filepath)
+    return absolute_filepath
+
+
+def ensure_executable(filepath: str, preserve_mode: bool = False) -> str:
     """Ensure a file is executable by the current user.
 
-    This is a no-op on Windows. On Linux/MacOS it sets the executable bit.
+    This is a no-op on Windows. On Linux/MacOS it sets the mode to `0o750`, matching
+    the mode of the binary cache directories, with a single syscall.
 
     Args:
         filepath: Path to the file to make executable.
+        preserve_mode: If True, keep the existing mode and only add the user executable bit.
 
     Returns:
         Same value as filepath argument.
     """
     if platform.system() != "Windows":
-        # Add executable permissions for user
-        current_permissions = os.stat(filepath).st_mode
-        os.chmod(filepath, current_permissions | stat.S_IXUSR)
+        if preserve_mode:
+            # Add executable permissions for user
+            current_permissions = os.stat(filepath).st_mode
+            os.chmod(filepath, current_permissions | stat.S_IXUSR)
+        else:
+            os.chmod(filepath, _EXECUTABLE_MODE)
     return filepath
 
 
+def _tar_data_flatten_filter(tarinfo: "tarfile.TarInfo", dest_path: str) -> "tarfile.TarInfo":
+    """Tar extraction filter that inherits from the 'data' filter and flattens the path.
+
+    Flattening avoids directory traversal issues.
+
+    Args:
+        tarinfo: Archive member to extract.
+        dest_path: Directory in which the member is extracted.
+
+    Returns:
+        Filtered archive member with its path flattened to its basename.
+    """
+    import tarfile
+
+    # Flatten the file's path
+    tarinfo.name = os.path.basename(tarinfo.name)
+
+    # apply the data filter to check for absolute paths, traversal, links, devs, etc.
+    return tarfile.data_filter(tarinfo, dest_path)
+
+
 # TODO add support for MacOS universals, bsd pkg
 def extract_file(archive_filepath: str, internal_filepath: str, dest_dir: str) -> str:
     """Extract a specific file from an archive to a destination directory.
@@ -177,6 +542,8 @@ def extract_file(archive_filepath: str, internal_filepath: str, dest_dir: str) -
 
     # Extract based on file extension; with safety checks not possible with shutil.unpack_archive
     if archive_filepath.endswith(".zip"):
+        import zipfile
+
         with zipfile.ZipFile(archive_filepath, "r") as zipf:
             # get info for the target file
             # module internally uses only forward slashes to comply with archive spec
@@ -192,6 +559,8 @@ def extract_file(archive_filepath: str, internal_filepath: str, dest_dir: str) -
 
     elif archive_filepath.endswith(".tgz") or archive_filepath.endswith(".tar.gz"):
         # For Linux .tgz files
+        import tarfile
+
         with tarfile.open(archive_filepath, "r:gz") as tarf:
             # get info for the target file
             # module internally uses only forward slashes to comply with archive spec
@@ -201,19 +570,8 @@ def extract_file(archive_filepath: str, internal_filepath: str, dest_dir: str) -
             if not tar_info.isfile() or tar_info.size == 0:
                 raise RuntimeError(f"File {internal_filepath} is empty or not a file.")
 
-            # custom filter that inherits from 'data' filter and flattens the path
-            # to avoid directory traversal issues
-            def data_flatten_filter(tarinfo: tarfile.TarInfo, dest_path: str) -> tarfile.TarInfo:
-                # Flatten the file's path
-                tarinfo.name = os.path.basename(tarinfo.name)
-
-                # apply the data filter to check for absolute paths, traversal, links, devs, etc.
-                tarinfo = tarfile.data_filter(tarinfo, dest_path)
-
-                return tarinfo
-
             # extract with custom filter directly to final_path
-            tarf.extract(tar_info, dest_dir, filter=data_flatten_filter)
+            tarf.extract(tar_info, dest_dir, filter=_tar_data_flatten_filter)
 
     else:
         raise RuntimeError(f"Unsupported archive format: {archive_filepath}")
@@ -276,8 +634,7 @@ class BinaryManager:
         # resolve cache_root
         if bin_root:
             # expand environment variables and user directory
-            cache_root = os.path.expandvars(bin_root)
-            cache_root = os.path.expanduser(cache_root)
+            cache_root = os.path.expanduser(os.path.expandvars(bin_root))
 
             # check if the path is absolute
             if not os.path.isabs(cache_root):
@@ -290,30 +647,34 @@ class BinaryManager:
         provider_name = provider_class.__name__.lower()
 
         # create the provider-specific cache directory
-        cache_root = os.path.join(cache_root, platform.system(), platform.machine(), provider_name)
-
-        # make canonical (absolute and normalized) path
-        cache_root = os.path.abspath(cache_root)
+        # cache_root is already absolute, so only normalize it; avoids a second abspath() which
+        # on Windows is a GetFullPathNameW call. All paths derived from it stay canonical.
+        cache_root = os.path.normpath(
+            os.path.join(cache_root, platform.system(), platform.machine(), provider_name)
+        )
 
         # create the directory if it doesn't exist
         os.makedirs(cache_root, mode=0o750, exist_ok=True)
         self._cache_root = cache_root
         logger.info(f"Binary cache at {cache_root}")
 
-    def _cache_dir_for_url(self, url: str) -> str:
+    def _cache_dir_for_url(self, url: str, create: bool = True) -> str:
         """Create and return the cache absolute directory for a given URL.
 
         Args:
             url: URL for which to get the cache directory, likely just before downloading.
+            create: Whether to create the directory if it doesn't exist.
 
         Returns:
             Cache absolute directory for the URL.
         """
         # Construct the cache directory for the URL
-        cache_dir = os.path.join(self._cache_root, hash_b64encode(data=url))
+        # internal cache key, so use the faster blake2b rather than sha256
+        cache_dir = os.path.join(self._cache_root, hash_b64encode(data=url, algorithm="blake2b"))
 
         # create the directory if it doesn't exist
-        os.makedirs(cache_dir, mode=0o750, exist_ok=True)
+        if create:
+            os.makedirs(cache_dir, mode=0o750, exist_ok=True)
         return cache_dir
 
     def _retrieve_from_cache(self, url: str, filename: str) -> str | None:
@@ -327,8 +688,13 @@ class BinaryManager:
             Absolute path to the cached file if it exists, otherwise None.
         """
         # construct the full path for a potentially cached file
-        cached_filepath = os.path.join(self._cache_dir_for_url(url=url), filename)
-        return cached_filepath if os.path.exists(cached_filepath) else None
+        # no need to create the url cache directory only to probe it
+        cached_filepath = os.path.join(self._cache_dir_for_url(url=url, create=False), filename)
+
+        # always check the filesystem, a cached file may be removed by another process
+        if os.path.isfile(cached_filepath):
+            return cached_filepath
+        return None
 
     def download_extract(
         self,
@@ -336,6 +702,7 @@ class BinaryManager:
         internal_filepath: str,
         hash_sha256: str | None = None,
         dest_dir: str | None = None,
+        mirror_urls: Sequence[str] = (),
     ) -> str:
         """Download and extract a specific file from an archive.
 
@@ -347,6 +714,8 @@ class BinaryManager:
             dest_dir: Directory in which to extract the file.
                 - None (default) = binaries are automatically stored/retrieved within a cache
                 - str = downloads always occur, never cached, and stored in given directory
+            mirror_urls: Mirror URLs serving the identical archive. When provided, the archive
+                is downloaded in parallel byte ranges from the URL and its mirrors.
 
         Returns:
             Absolute path to the cached or downloaded+extracted file
@@ -355,29 +724,78 @@ class BinaryManager:
             RuntimeError: If the archive format is not supported or contains unsafe paths,
                 or if the archive's hash does not match the expected hash.
         """
-        # check cache
-        if not dest_dir:
-            # check for the file in the cache directory
-            cached_filepath = self._retrieve_from_cache(
-                url=url, filename=verified_basename(internal_filepath)
-            )
+        # get last part of the URL for the archive filename
+        archive_filename = verified_basename(filepath=urlsplit(url).path)
+
+        # never cached, so download the archive into a temporary directory
+        if dest_dir:
+            with TemporaryDirectory() as temp_dir:
+                return self._download_extract(
+                    url=url,
+                    internal_filepath=internal_filepath,
+                    hash_sha256=hash_sha256,
+                    dest_dir=dest_dir,
+                    download_filepath=os.path.join(temp_dir, archive_filename),
+                    mirror_urls=mirror_urls,
+                )
+
+        # check for the file in the cache directory
+        filename = verified_basename(internal_filepath)
+        cached_filepath = self._retrieve_from_cache(url=url, filename=filename)
+        if cached_filepath:
+            return cached_filepath
+
+        # download the archive within the URL's cache directory, rather than a temporary
+        # directory, so the `.part` file of an interrupted download is resumed by a later call
+        dest_dir = self._cache_dir_for_url(url=url)
+        download_dir = os.path.join(dest_dir, ".download")
+        os.makedirs(download_dir, mode=0o750, exist_ok=True)
+
+        # only one caller at a time, in any process, resumes, extracts, and removes the archive
+        with _exclusive_lock(os.path.join(download_dir, archive_filename + ".lock")):
+            # another caller may have cached the file while this one waited for the lock
+            cached_filepath = self._retrieve_from_cache(url=url, filename=filename)
             if cached_filepath:
                 return cached_filepath
+            return self._download_extract(
+                url=url,
+                internal_filepath=internal_filepath,
+                hash_sha256=hash_sha256,
+                dest_dir=dest_dir,
+                download_filepath=os.path.join(download_dir, archive_filename),
+                mirror_urls=mirror_urls,
+            )
 
-            # if not found, set dest_dir to the cache directory
-            dest_dir = self._cache_dir_for_url(url=url)
+    def _download_extract(
+        self,
+        url: str,
+        internal_filepath: str,
+        hash_sha256: str | None,
+        dest_dir: str,
+        download_filepath: str,
+        mirror_urls: Sequence[str],
+    ) -> str:
+        """Download an archive, verify it, extract a specific file, then remove the archive.
 
-        # create temp directory for the downloaded archive
-        with TemporaryDirectory() as temp_dir:
-            # get last part of the URL for the archive filename
-            archive_filename = verified_basename(filepath=urlsplit(url).path)
+        Args:
+            url: URL from which to download the archive.
+            internal_filepath: Internal archive file path to extract.
+            hash_sha256: Expected SHA-256 hash of the archive. If None, skip verification.
+            dest_dir: Directory in which to extract the file.
+            download_filepath: Local path+filename to which the archive is downloaded.
+            mirror_urls: Mirror URLs serving the identical archive.
 
-            # construct the full path for the downloaded archive file
-            # and download the archive
-            archive_filepath = download_file(
-                url=url, dest_filepath=os.path.join(temp_dir, archive_filename)
+        Returns:
+            Absolute path to the extracted file.
+        """
+        if mirror_urls:
+            archive_filepath = download_file_parallel(
+                urls=[url, *mirror_urls], dest_filepath=download_filepath
             )
+        else:
+            archive_filepath = download_file(url=url, dest_filepath=download_filepath)
 
+        try:
             # verify hash of archive
             if hash_sha256:
                 verify_sha256(archive_filepath, hash_sha256)
@@ -390,3 +808,6 @@ class BinaryManager:
                     dest_dir=dest_dir,
                 )
             )
+        finally:
+            # the complete archive is no longer needed
+            os.remove(archive_filepath)
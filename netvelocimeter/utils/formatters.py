@@ -1,55 +1,115 @@
 """Pretty formatters used in class __format__ methods."""
 
-from collections.abc import Sequence
-from enum import Enum
+from collections.abc import Iterator
 import logging
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Maximum width of the label column; longer labels are on their own line
+_MAX_LABEL_WIDTH = 48
+
+
+# Formattable field names of dataclass types, and the field name prefix of types flattened as
+# nested objects or None when not nested. Types do not change after creation so entries are
+# never invalidated.
+_FIELD_NAMES_CACHE: dict[type, tuple[str, ...]] = {}
+_NESTED_PREFIX_CACHE: dict[type, str | None] = {}
+
+
+def _field_names(obj: object) -> tuple[str, ...]:
+    """Get the names of the formattable fields of an object.
+
+    Args:
+        obj: The object, which can be a dataclass or any class with __dict__.
+
+    Returns:
+        Names of the public fields, excluding `raw`. Empty if the object has no fields.
+    """
+    obj_type = type(obj)
+    try:
+        return _FIELD_NAMES_CACHE[obj_type]
+    except KeyError:
+        pass
+
+    if hasattr(obj_type, "__dataclass_fields__"):
+        field_names = obj_type.__dataclass_fields__.keys()
+    elif hasattr(obj, "__dict__"):
+        # instance attributes can differ between instances so they are not cached
+        return tuple(name for name in obj.__dict__ if not name.startswith("_") and name != "raw")
+    else:
+        field_names = ()
+
+    names = tuple(name for name in field_names if not name.startswith("_") and name != "raw")
+    _FIELD_NAMES_CACHE[obj_type] = names
+    return names
+
+
+def _nested_prefix(value: object) -> str | None:
+    """Get the field name prefix of a value whose fields are flattened.
+
+    Args:
+        value: The field value to check.
+
+    Returns:
+        The class-level `_format_prefix` of the value's type, or "" if it has none, when the value
+        is a dataclass or has __dict__, and is not an Enum. Otherwise None.
+    """
+    value_type = type(value)
+    try:
+        return _NESTED_PREFIX_CACHE[value_type]
+    except KeyError:
+        # Enum types have `_member_map_`; avoids the slower Enum metaclass instance check
+        nested = not hasattr(value_type, "_member_map_") and (
+            hasattr(value, "__dict__") or hasattr(value, "__dataclass_fields__")
+        )
+        prefix = getattr(value_type, "_format_prefix", "") if nested else None
+        _NESTED_PREFIX_CACHE[value_type] = prefix
+        return prefix
+
 
 def _flatten_fields(obj: object, prefix: str = "") -> tuple[list[tuple[str, object]], int]:
     """Flatten the object graph into a list of (field_name, value) and find max width.
 
     Args:
         obj: The object to flatten, which can be a dataclass or any class with __dict__.
-        prefix: Prefix to prepend to field names. Nested objects can set this via their `_format_prefix` attribute.
+        prefix: Prefix to prepend to field names. Nested objects can set this via their class-level
+            `_format_prefix` attribute.
 
     Returns:
         Tuple:
             1. list of (field_name, value) pairs
-            2. maximum width of all field names + 1 to account for a colon after every field name
+            2. maximum width of all field names + 1 to account for a colon after every field name,
+               capped at `_MAX_LABEL_WIDTH`
     """
-    fields = []
+    fields: list[tuple[str, object]] = []
     max_width = 0
 
-    if hasattr(obj, "__dataclass_fields__"):
-        field_names = obj.__dataclass_fields__.keys()
-    elif hasattr(obj, "__dict__"):
-        field_names = obj.__dict__.keys()
-    else:
-        return [], 0
-
-    field_names = [name for name in field_names if not name.startswith("_") and name != "raw"]
-
-    for name in field_names:
-        value = getattr(obj, name)
-        if value is None:
-            continue
-        field_label = f"{prefix}{name}:"
-        max_width = max(max_width, len(field_label))
-        # Recurse for nested objects
-        if not isinstance(value, Enum) and (
-            hasattr(value, "__dict__") or hasattr(value, "__dataclass_fields__")
-        ):
-            nested_prefix = getattr(value, "_format_prefix", "")
-            logger.debug(f"Flatten nested: {name} type={type(value)} prefix={nested_prefix}")
-            nested_fields, nested_width = _flatten_fields(value, nested_prefix)
-            fields.extend(nested_fields)
-            max_width = max(max_width, nested_width)
-        else:
+    # Depth-first walk with an explicit stack of field name iterators instead of recursion.
+    # Nested objects are pushed and walked immediately to keep fields in display order.
+    stack = [(obj, prefix, iter(_field_names(obj)))]
+    while stack:
+        current, current_prefix, names = stack[-1]
+        for name in names:
+            value = getattr(current, name)
+            if value is None:
+                continue
+            field_label = f"{current_prefix}{name}:"
+            max_width = max(max_width, len(field_label))
+            # Descend into nested objects
+            nested_prefix = _nested_prefix(value)
+            if nested_prefix is not None:
+                # lazy %-style args avoid formatting on this hot path when debug is disabled
+                logger.debug(
+                    "Flatten nested: %s type=%s prefix=%s", name, type(value), nested_prefix
+                )
+                stack.append((value, nested_prefix, iter(_field_names(value))))
+                break
             fields.append((field_label, value))
-    return fields, max_width
+        else:
+            # all fields of the current object are done, resume its parent
+            stack.pop()
+    return fields, min(max_width, _MAX_LABEL_WIDTH)
 
 
 def pretty_print_two_columns(obj: object, prefix: str) -> str:
@@ -63,17 +123,25 @@ def pretty_print_two_columns(obj: object, prefix: str) -> str:
         A formatted string representing the object in two columns.
     """
     fields, field_width = _flatten_fields(obj, prefix)
-    lines = []
+    indent = " " * (field_width + 1)
+    lines: list[str] = []
     for field_label, value in fields:
-        # Normalize value to sequence for multi-line values
-        if isinstance(value, str) or not isinstance(value, Sequence):
-            value = [value]
-
-        # Handle single-line and multi-line values
-        iterator = iter(value)
-        lines.append(f"{field_label:<{field_width}} {next(iterator)}")
-        for line in iterator:
-            lines.append(" " * field_width + f" {line}")
+        # Multi-line values are lists or tuples; concrete types avoid the slower Sequence ABC check
+        iterator: Iterator[object]
+        if isinstance(value, (list, tuple)):
+            iterator = iter(value)
+            first_line = format(next(iterator))
+        else:
+            iterator = iter(())
+            first_line = format(value)
+
+        # Labels wider than the label column are on their own line and the value starts indented
+        if len(field_label) > field_width:
+            lines.append(field_label)
+            lines.append(indent + first_line)
+        else:
+            lines.append(field_label.ljust(field_width) + " " + first_line)
+        lines.extend([indent + format(line) for line in iterator])
 
     # Return the formatted string with each line separated by a newline
     return "\n".join(lines)
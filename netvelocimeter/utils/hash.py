@@ -1,10 +1,24 @@
 """Hashing utilities for creating unique identifiers."""
 
 from base64 import urlsafe_b64encode
-from hashlib import sha256
+from collections.abc import Callable
+from functools import lru_cache, partial
+from hashlib import blake2b, sha256
+from typing import Any, Literal
 
+# Supported hash algorithms for identifiers
+# blake2b is BLAKE2b-128 which produces exactly the 22 base64 characters kept by default
+_HASHERS: dict[str, Callable[[bytes], Any]] = {
+    "sha256": sha256,
+    "blake2b": partial(blake2b, digest_size=16),
+}
 
-def hash_b64encode(data: str | bytes, truncate: int | None = 22) -> str:
+
+def hash_b64encode(
+    data: str | bytes,
+    truncate: int | None = 22,
+    algorithm: Literal["sha256", "blake2b"] = "blake2b",
+) -> str:
     """Hash data to create a unique identifier.
 
     Args:
@@ -12,23 +26,58 @@ def hash_b64encode(data: str | bytes, truncate: int | None = 22) -> str:
         truncate: integer character length of the hash to return or `None` for the full hash.
         Default is 22 characters which is ~128 bits of the hash. This is sufficient to avoid
             collisions for most practical applications.
+        algorithm: hash algorithm to use. Default "blake2b" is BLAKE2b-128, its full hash is
+            22 characters. "sha256" is slower and kept for identifiers of persisted data.
 
     Returns:
         A unique identifier for the data, encoded in url-safe base64 with padding `=` removed.
         Url-safe alphabet uses `-` instead of `+` and `_` instead of `/`.
+
+    Raises:
+        ValueError: If data is not a string or bytes, or the algorithm is not supported.
     """
     # validate and covert data
     if isinstance(data, str):
         data = data.encode("utf-8")
     elif not isinstance(data, bytes):
         raise ValueError("Data must be a string or bytes.")
+    return _hash_bytes(data, truncate, algorithm)
+
+
+@lru_cache(maxsize=1024)
+def _hash_bytes(data: bytes, truncate: int | None, algorithm: str) -> str:
+    """Hash bytes and encode as url-safe base64, memoized for repeated identifiers.
+
+    Args:
+        data: bytes to hash.
+        truncate: integer character length of the hash to return or `None` for the full hash.
+        algorithm: hash algorithm to use.
 
+    Returns:
+        The hash encoded in url-safe base64 with padding `=` removed.
+
+    Raises:
+        ValueError: If the algorithm is not supported.
+    """
     # Hash the data
-    data_hash = sha256(data).digest()
+    try:
+        data_hash = _HASHERS[algorithm](data).digest()
+    except KeyError as e:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}") from e
 
-    # Convert to URL-safe base64 and remove padding
+    # Convert to URL-safe base64
     # This creates shorter directory names that are still filesystem-safe
-    data_hash_base64 = urlsafe_b64encode(data_hash).decode("ascii").rstrip("=")
+    data_hash_base64 = urlsafe_b64encode(data_hash).decode("ascii")
+
+    # padding `=` only trails the encoded hash, so truncating within the unpadded length
+    # needs no padding removal
+    if truncate is not None and 0 <= truncate <= (len(data_hash) * 4 + 2) // 3:
+        return data_hash_base64[:truncate]
+
+    # remove padding and truncate the hash to the specified length
+    return data_hash_base64.rstrip("=")[:truncate]
+
 
-    # truncate the hash to the specified length
-    return data_hash_base64[:truncate]
+# expose the cache for tests and memory management
+hash_b64encode.cache_clear = _hash_bytes.cache_clear  # type: ignore[attr-defined]
+hash_b64encode.cache_info = _hash_bytes.cache_info  # type: ignore[attr-defined]
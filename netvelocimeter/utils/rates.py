@@ -31,11 +31,12 @@ class DataRateMbps(float):
         Returns:
             A formatted string representing the data rate in Mbps.
         """
-        # Default format spec if none provided
+        # Fast path for the default format spec used by nearly all callers.
+        # printf-style formatting is measurably faster than format() for this fixed spec.
         if not format_spec:
-            format_spec = ".2f"
+            return "%.2f Mbps" % self  # noqa: UP031
 
-        return f"{super().__format__(format_spec)} Mbps"
+        return float.__format__(self, format_spec) + " Mbps"
 
 
 class Percentage(float):
@@ -66,11 +67,12 @@ class Percentage(float):
         Returns:
             A formatted string representing the percentage value.
         """
-        # Default format spec if none provided
+        # Fast path for the default format spec used by nearly all callers.
+        # printf-style formatting is measurably faster than format() for this fixed spec.
         if not format_spec:
-            format_spec = ".2f"
+            return "%.2f %%" % self  # noqa: UP031
 
-        return f"{super().__format__(format_spec)} %"
+        return float.__format__(self, format_spec) + " %"
 
 
 class TimeDuration(timedelta):
@@ -86,7 +88,7 @@ class TimeDuration(timedelta):
         - 'ns' for nanoseconds
     """
 
-    # Mapping of format suffixes to their units and conversion factors
+    # Mapping of two character format suffixes to their units and conversion factors
     TIME_SPECS = {
         "ss": ("s", 1),
         "ms": ("ms", 1_000),
@@ -126,13 +128,12 @@ class TimeDuration(timedelta):
         if not format_spec:
             format_spec = ".2fms"
 
-        # Check for recognized unit suffixes
-        for candidate in self.TIME_SPECS:
-            if format_spec.endswith(candidate):
-                std_spec = format_spec[:-2] or ".0f"
-                value = self.total_seconds() * self.TIME_SPECS[candidate][1]
-                return f"{format(value, std_spec)} {self.TIME_SPECS[candidate][0]}"
+        # Look up the unit suffix directly, all suffixes are two characters
+        time_spec = self.TIME_SPECS.get(format_spec[-2:])
 
         # No recognized unit suffix, treat as seconds
-        value = self.total_seconds()
-        return format(value, format_spec)
+        if time_spec is None:
+            return format(self.total_seconds(), format_spec)
+
+        unit, scale = time_spec
+        return f"{format(self.total_seconds() * scale, format_spec[:-2] or '.0f')} {unit}"
@@ -11,6 +11,9 @@ import os
 import platform
 from typing import cast
 
+# The platform never changes at runtime
+_IS_WINDOWS = platform.system() == "Windows"
+
 
 def _expand_path(path: str | None) -> str | None:
     """Expand environment variables and user directory in a path.
@@ -86,11 +89,7 @@ class XDGSystemPaths:
         Returns:
             Resolved and expanded path for current platform, or None if path can't be resolved
         """
-        return (
-            self.windows.resolve_path()
-            if platform.system() == "Windows"
-            else self.posix.resolve_path()
-        )
+        return self.windows.resolve_path() if _IS_WINDOWS else self.posix.resolve_path()
 
 
 @dataclass
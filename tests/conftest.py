@@ -20,18 +20,76 @@ def pytest_configure(config):
 
 def pytest_collection_modifyitems(config, items):
     """Modify collected test items based on command line options."""
-    run_expensive = config.getoption("--run-expensive")
-    run_only_expensive = config.getoption("--run-only-expensive")
+    # With pytest-xdist, group tests by module so `--dist=loadgroup` runs each module on one worker
+    group_by_module = config.pluginmanager.hasplugin("xdist")
 
-    # If run-only-expensive is specified, skip all non-expensive tests
-    if run_only_expensive:
+    # If run-only-expensive is specified, skip all non-expensive tests.
+    # Otherwise if run-expensive is not specified, skip expensive tests.
+    skip_non_expensive = skip_expensive = None
+    if config.getoption("--run-only-expensive"):
         skip_non_expensive = pytest.mark.skip(reason="only running expensive tests")
-        for item in items:
-            if "expensive" not in item.keywords:
-                item.add_marker(skip_non_expensive)
-    # Otherwise if run-expensive is not specified, skip expensive tests
-    elif not run_expensive:
+    elif not config.getoption("--run-expensive"):
         skip_expensive = pytest.mark.skip(reason="need --run-expensive option to run")
-        for item in items:
-            if "expensive" in item.keywords:
+
+    # Apply all markers in one pass over the items
+    for item in items:
+        if group_by_module:
+            item.add_marker(pytest.mark.xdist_group(item.module.__name__))
+        if "expensive" in item.keywords:
+            if skip_expensive:
                 item.add_marker(skip_expensive)
+        elif skip_non_expensive:
+            item.add_marker(skip_non_expensive)
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """CLI runner shared by all CLI tests."""
+    from typer.testing import CliRunner
+
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli_app():
+    """CLI application shared by all CLI tests."""
+    from netvelocimeter.cli import app
+
+    return app
+
+
+@pytest.fixture(scope="class")
+def cli(request, cli_runner, cli_app):
+    """Bind the shared CLI runner and application to a test class as `runner` and `app`."""
+    request.cls.runner = cli_runner
+    request.cls.app = cli_app
+
+
+@pytest.fixture(scope="session")
+def static_legal_json(cli_runner, cli_app):
+    """JSON list of the static provider's legal terms, listed once for the session."""
+    result = cli_runner.invoke(cli_app, ["--provider=static", "--format=json", "legal", "list"])
+    assert result.exit_code == 0, result.stderr
+    return result.stdout.strip()
+
+
+@pytest.fixture(scope="session")
+def static_accepted_config(tmp_path_factory, cli_runner, cli_app, static_legal_json):
+    """Config directory in which all static provider legal terms are accepted, built once.
+
+    Tests copy it rather than use it directly so each test can change its own copy.
+    """
+    config_root = tmp_path_factory.mktemp("static_accepted_config")
+    result = cli_runner.invoke(
+        cli_app,
+        ["--provider=static", "--config-root", str(config_root), "legal", "accept"],
+        input=static_legal_json,
+    )
+    assert result.exit_code == 0, result.stderr
+    return config_root
+
+
+@pytest.fixture
+def legal_json(request, static_legal_json):
+    """Bind the static provider's legal terms to a test instance as `static_legal_json`."""
+    request.instance.static_legal_json = static_legal_json
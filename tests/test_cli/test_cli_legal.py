@@ -1,30 +1,28 @@
 """Tests for CLI legal command."""
 
-import shutil
-import tempfile
+import json
+import re
 import unittest
 
-from typer.testing import CliRunner
+import pytest
 
-from netvelocimeter.cli import app
-
-runner = CliRunner()
+# Acceptance status fields in the legal status output, compiled once for all tests
+_RE_ACCEPTED_TRUE = re.compile(r"accepted:\s+true", re.IGNORECASE)
+_RE_ACCEPTED_FALSE = re.compile(r"accepted:\s+false", re.IGNORECASE)
 
 
+@pytest.mark.usefixtures("cli")
 class TestLegalCommand(unittest.TestCase):
     """Test cases for the CLI legal command."""
 
-    def setUp(self):
-        """Set up a clean test directory."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up test directory."""
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        """Set up a clean test directory private to each test and worker."""
+        self.temp_dir = str(tmp_path)
 
     def test_cli_legal_list(self):
         """Test the CLI app with a simple command."""
-        result = runner.invoke(app, ["--provider=static", "legal", "list"])
+        result = self.runner.invoke(self.app, ["--provider=static", "legal", "list"])
         self.assertEqual(result.exit_code, 0)
         self.assertIn("category: eula", result.stdout)
         self.assertIn("category: privacy", result.stdout)
@@ -32,50 +30,66 @@ class TestLegalCommand(unittest.TestCase):
 
     def test_cli_legal_list_category_eula(self):
         """Test listing legal terms by eula category."""
-        result = runner.invoke(app, ["--provider=static", "legal", "list", "--category", "eula"])
+        result = self.runner.invoke(
+            self.app, ["--provider=static", "legal", "list", "--category", "eula"]
+        )
         self.assertEqual(result.exit_code, 0)
-        self.assertIn("category: eula", result.stdout.lower())
-        self.assertNotIn("category: privacy", result.stdout.lower())
-        self.assertNotIn("category: service", result.stdout.lower())
+        stdout = result.stdout.lower()
+        self.assertIn("category: eula", stdout)
+        self.assertNotIn("category: privacy", stdout)
+        self.assertNotIn("category: service", stdout)
 
     def test_cli_legal_list_category_privacy(self):
         """Test listing legal terms by privacy category."""
-        result = runner.invoke(app, ["--provider=static", "legal", "list", "--category", "privacy"])
+        result = self.runner.invoke(
+            self.app, ["--provider=static", "legal", "list", "--category", "privacy"]
+        )
         self.assertEqual(result.exit_code, 0)
-        self.assertIn("category: privacy", result.stdout.lower())
-        self.assertNotIn("category: eula", result.stdout.lower())
-        self.assertNotIn("category: service", result.stdout.lower())
+        stdout = result.stdout.lower()
+        self.assertIn("category: privacy", stdout)
+        self.assertNotIn("category: eula", stdout)
+        self.assertNotIn("category: service", stdout)
 
     def test_cli_legal_list_category_service(self):
         """Test listing legal terms by service category."""
-        result = runner.invoke(app, ["--provider=static", "legal", "list", "--category", "service"])
+        result = self.runner.invoke(
+            self.app, ["--provider=static", "legal", "list", "--category", "service"]
+        )
         self.assertEqual(result.exit_code, 0)
-        self.assertIn("category: service", result.stdout.lower())
-        self.assertNotIn("category: eula", result.stdout.lower())
-        self.assertNotIn("category: privacy", result.stdout.lower())
+        stdout = result.stdout.lower()
+        self.assertIn("category: service", stdout)
+        self.assertNotIn("category: eula", stdout)
+        self.assertNotIn("category: privacy", stdout)
 
     def test_cli_legal_status_all(self):
         """Test the CLI app with legal status command."""
-        result = runner.invoke(
-            app, ["--provider=static", "--config-root", self.temp_dir, "legal", "status"]
+        result = self.runner.invoke(
+            self.app,
+            [
+                "--provider=static",
+                "--config-root",
+                self.temp_dir,
+                "--format=json",
+                "legal",
+                "status",
+            ],
         )
         # Expecting 1 because no terms are accepted in temp config dir
         self.assertEqual(result.exit_code, 1)
-        # Check that accepted false appears 3 times in stdout
-        self.assertEqual(result.stdout.count("accepted:"), 3)
-        self.assertEqual(result.stdout.count("False"), 3)
-        self.assertIn("category: eula", result.stdout.lower())
-        self.assertIn("category: privacy", result.stdout.lower())
-        self.assertIn("category: service", result.stdout.lower())
+        # Check that all 3 terms are not accepted
+        terms = json.loads(result.stdout)
+        self.assertEqual([term["accepted"] for term in terms], [False, False, False])
+        self.assertCountEqual([term["category"] for term in terms], ["eula", "privacy", "service"])
 
     def test_cli_legal_status_category_eula(self):
         """Test the CLI app with legal status command for eula category."""
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "--provider=static",
                 "--config-root",
                 self.temp_dir,
+                "--format=json",
                 "legal",
                 "status",
                 "--category",
@@ -83,17 +97,15 @@ class TestLegalCommand(unittest.TestCase):
             ],
         )
         self.assertEqual(result.exit_code, 1)
-        self.assertEqual(result.stdout.lower().count("accepted:"), 1)
-        self.assertEqual(result.stdout.lower().count("false"), 1)
-        self.assertNotIn("true", result.stdout.lower())
-        self.assertIn("category: eula", result.stdout.lower())
-        self.assertNotIn("category: privacy", result.stdout.lower())
-        self.assertNotIn("category: service", result.stdout.lower())
+        terms = json.loads(result.stdout)
+        self.assertEqual(len(terms), 1)
+        self.assertEqual(terms[0]["category"], "eula")
+        self.assertFalse(terms[0]["accepted"])
 
     def test_cli_legal_accept_invalid_json(self):
         """Test the CLI app with legal accept command with invalid JSON input."""
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             ["--provider=static", "--config-root", self.temp_dir, "legal", "accept"],
             input="{notjson",
         )
@@ -102,8 +114,10 @@ class TestLegalCommand(unittest.TestCase):
 
     def test_cli_legal_accept_empty(self):
         """Test the CLI app with legal accept command with empty input."""
-        result = runner.invoke(
-            app, ["--provider=static", "--config-root", self.temp_dir, "legal", "accept"], input=""
+        result = self.runner.invoke(
+            self.app,
+            ["--provider=static", "--config-root", self.temp_dir, "legal", "accept"],
+            input="",
         )
         self.assertNotEqual(result.exit_code, 0)
         self.assertIn("no legal terms provided", result.stderr.lower())
@@ -111,8 +125,8 @@ class TestLegalCommand(unittest.TestCase):
     def test_cli_legal_accept_valid_eula(self):
         """Test the CLI app with legal accept command with valid JSON input for eula."""
         # check if terms are accepted
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "--provider=static",
                 "--config-root",
@@ -124,15 +138,15 @@ class TestLegalCommand(unittest.TestCase):
             ],
         )
         self.assertEqual(result.exit_code, 1)
-        self.assertRegex(result.stdout.lower(), r"accepted:\s+false")
-        self.assertNotRegex(result.stdout.lower(), r"accepted:\s+true")
+        self.assertRegex(result.stdout, _RE_ACCEPTED_FALSE)
+        self.assertNotRegex(result.stdout, _RE_ACCEPTED_TRUE)
 
         # accept eula
         json_input = (
             '[{"text": "Test EULA", "url": "https://example.com/eula", "category": "eula"}]'
         )
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             ["--provider=static", "--config-root", self.temp_dir, "legal", "accept"],
             input=json_input,
         )
@@ -141,8 +155,8 @@ class TestLegalCommand(unittest.TestCase):
         self.assertFalse(result.stderr)
 
         # check if eula terms are accepted
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "--provider=static",
                 "--config-root",
@@ -154,25 +168,25 @@ class TestLegalCommand(unittest.TestCase):
             ],
         )
         self.assertEqual(result.exit_code, 0)
-        self.assertRegex(result.stdout.lower(), r"accepted:\s+true")
+        self.assertRegex(result.stdout, _RE_ACCEPTED_TRUE)
 
         # check of all terms are accepted
-        result = runner.invoke(
-            app, ["--provider=static", "--config-root", self.temp_dir, "legal", "status"]
+        result = self.runner.invoke(
+            self.app, ["--provider=static", "--config-root", self.temp_dir, "legal", "status"]
         )
         self.assertEqual(result.exit_code, 1)
-        self.assertRegex(result.stdout.lower(), r"accepted:\s+true")
-        self.assertRegex(result.stdout.lower(), r"accepted:\s+false")
+        self.assertRegex(result.stdout, _RE_ACCEPTED_TRUE)
+        self.assertRegex(result.stdout, _RE_ACCEPTED_FALSE)
 
     def test_cli_legal_accept_valid_all(self):
         """Test the CLI app with legal accept command with valid JSON input for all categories."""
         # check if terms are accepted
-        result = runner.invoke(
-            app, ["--provider=static", "--config-root", self.temp_dir, "legal", "status"]
+        result = self.runner.invoke(
+            self.app, ["--provider=static", "--config-root", self.temp_dir, "legal", "status"]
         )
         self.assertEqual(result.exit_code, 1)
-        self.assertRegex(result.stdout.lower(), r"accepted:\s+false")
-        self.assertNotRegex(result.stdout.lower(), r"accepted:\s+true")
+        self.assertRegex(result.stdout, _RE_ACCEPTED_FALSE)
+        self.assertNotRegex(result.stdout, _RE_ACCEPTED_TRUE)
 
         # accept all terms
         json_input = (
@@ -180,8 +194,8 @@ class TestLegalCommand(unittest.TestCase):
             '{"text": "Test Privacy", "url": "https://example.com/privacy", "category": "privacy"}, '
             '{"text": "Test Terms", "url": "https://example.com/terms", "category": "service"}]'
         )
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             ["--provider=static", "--config-root", self.temp_dir, "legal", "accept"],
             input=json_input,
         )
@@ -190,27 +204,27 @@ class TestLegalCommand(unittest.TestCase):
         self.assertFalse(result.stderr)
 
         # check if all terms are accepted
-        result = runner.invoke(
-            app, ["--provider=static", "--config-root", self.temp_dir, "legal", "status"]
+        result = self.runner.invoke(
+            self.app, ["--provider=static", "--config-root", self.temp_dir, "legal", "status"]
         )
         self.assertEqual(result.exit_code, 0)
-        self.assertRegex(result.stdout.lower(), r"accepted:\s+true")
-        self.assertNotRegex(result.stdout.lower(), r"accepted:\s+false")
+        self.assertRegex(result.stdout, _RE_ACCEPTED_TRUE)
+        self.assertNotRegex(result.stdout, _RE_ACCEPTED_FALSE)
 
     def test_cli_legal_list_help(self):
         """Test the CLI app with legal list command help."""
-        result = runner.invoke(app, ["legal", "list", "--help"])
+        result = self.runner.invoke(self.app, ["legal", "list", "--help"])
         self.assertEqual(result.exit_code, 0)
-        self.assertRegex(result.stdout, r"List legal terms(.|\n)+--category")
+        self.assertRegex(result.stdout, r"(?s)List legal terms.+--category")
 
     def test_cli_legal_status_help(self):
         """Test the CLI app with legal status command help."""
-        result = runner.invoke(app, ["legal", "status", "--help"])
+        result = self.runner.invoke(self.app, ["legal", "status", "--help"])
         self.assertEqual(result.exit_code, 0)
-        self.assertRegex(result.stdout, r"Status for(.|\n)+--category")
+        self.assertRegex(result.stdout, r"(?s)Status for.+--category")
 
     def test_cli_legal_accept_help(self):
         """Test the CLI app with legal accept command help."""
-        result = runner.invoke(app, ["legal", "accept", "--help"])
+        result = self.runner.invoke(self.app, ["legal", "accept", "--help"])
         self.assertEqual(result.exit_code, 0)
-        self.assertRegex(result.stdout, r"Accept legal terms(.|\n)+--help")
+        self.assertRegex(result.stdout, r"(?s)Accept legal terms.+--help")
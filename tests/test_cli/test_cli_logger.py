@@ -1,12 +1,13 @@
 """Tests for the CLI logger."""
 
+from concurrent.futures import ThreadPoolExecutor
 import io
 import logging
 import os
 import unittest
 from unittest import mock
 
-from netvelocimeter.cli.utils.logger import setup_cli_logging
+import pytest
 
 
 class TestLogger(unittest.TestCase):
@@ -18,6 +19,11 @@ class TestLogger(unittest.TestCase):
         self._orig_handlers = self.logger.handlers[:]
         self._orig_level = self.logger.level
 
+        # Importing the cli package builds the Typer app, so defer it from collection to run time
+        from netvelocimeter.cli.utils.logger import setup_cli_logging
+
+        self.setup_cli_logging = setup_cli_logging
+
     def tearDown(self):
         """Restore the original handlers and level for the netvelocimeter logger."""
         self.logger.handlers = self._orig_handlers
@@ -25,7 +31,7 @@ class TestLogger(unittest.TestCase):
 
     def test_setup_cli_logging_configures_root_logger(self):
         """Test setup_cli_logging configures the netvelocimeter logger for CLI."""
-        setup_cli_logging(log_level=logging.INFO)
+        self.setup_cli_logging(log_level=logging.INFO)
         root_logger = logging.getLogger("netvelocimeter")
         self.assertEqual(root_logger.level, logging.INFO)
         self.assertTrue(any(isinstance(h, logging.StreamHandler) for h in root_logger.handlers))
@@ -37,10 +43,31 @@ class TestLogger(unittest.TestCase):
         self.assertEqual(log.records[0].levelname, "INFO")
         self.assertIn("Test log message", log.output[0])
 
+    def test_setup_cli_logging_reuses_handler(self):
+        """Test repeated setup_cli_logging reuses the handler and only changes the level."""
+        self.setup_cli_logging(log_level=logging.INFO)
+        handlers = self.logger.handlers[:]
+        self.setup_cli_logging(log_level=logging.DEBUG)
+        self.assertEqual(self.logger.handlers, handlers)
+        self.assertEqual(self.logger.level, logging.DEBUG)
+
+        # A new stderr, e.g. redirected by a test runner, gets a new handler
+        with mock.patch("sys.stderr", io.StringIO()):
+            self.setup_cli_logging(log_level=logging.INFO)
+            self.assertEqual(len(self.logger.handlers), 1)
+            self.assertIsNot(self.logger.handlers[0], handlers[0])
+
+    def test_setup_cli_logging_concurrent(self):
+        """Test concurrent setup_cli_logging installs exactly one handler."""
+        self.logger.handlers = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(self.setup_cli_logging, [logging.INFO] * 32))
+        self.assertEqual(len(self.logger.handlers), 1)
+
     def test_setup_cli_logging_respects_env_variable(self):
         """Test setup_cli_logging respects NETVELOCIMETER_LOG_LEVEL env variable."""
         with mock.patch.dict(os.environ, {"NETVELOCIMETER_LOG_LEVEL": "INFO"}):
-            setup_cli_logging()
+            self.setup_cli_logging()
             root_logger = logging.getLogger("netvelocimeter")
             self.assertEqual(root_logger.level, logging.INFO)
 
@@ -50,42 +77,36 @@ class TestLogger(unittest.TestCase):
             mock.patch.dict(os.environ, {"NETVELOCIMETER_LOG_LEVEL": "INVALID"}),
             mock.patch("logging.Logger.error") as mock_error,
         ):
-            setup_cli_logging()
+            self.setup_cli_logging()
             root_logger = logging.getLogger("netvelocimeter")
             self.assertEqual(root_logger.level, logging.ERROR)
             mock_error.assert_called_once()
 
+    @pytest.fixture
+    def _cli_log_buffer(self):
+        """Configure CLI logging at DEBUG and capture its console handler output in a buffer."""
+        from netvelocimeter.cli.utils import logger as cli_logger
+
+        root_logger = logging.getLogger("netvelocimeter")
+        orig_handlers = root_logger.handlers[:]
+        orig_level = root_logger.level
+
+        # Ensure CLI logging is configured with the real handler/formatter, then swap its stream
+        cli_logger.setup_cli_logging(log_level=logging.DEBUG)
+        self.log_buffer = io.StringIO()
+        orig_stream = cli_logger._cli_handler.setStream(self.log_buffer)
+        yield
+
+        # Restore the stream, handlers, and level to avoid side effects
+        cli_logger._cli_handler.setStream(orig_stream)
+        root_logger.handlers = orig_handlers
+        root_logger.setLevel(orig_level)
+
+    @pytest.mark.usefixtures("_cli_log_buffer")
     def test_log_format_and_utc(self):
         """Test log message format and UTC timestamp."""
-        # Ensure CLI logging is configured with the real handler/formatter
-        setup_cli_logging(log_level=logging.DEBUG)
-        logger = logging.getLogger("netvelocimeter")
-
-        # Find the first StreamHandler attached by setup_cli_logging
-        stream_handler = None
-        for handler in logger.handlers:
-            if isinstance(handler, logging.StreamHandler):
-                stream_handler = handler
-                break
-        self.assertIsNotNone(stream_handler, "No StreamHandler found on netvelocimeter root logger")
-
-        # Save the original stream to restore later to avoid side effects
-        original_stream = stream_handler.stream
-
-        # Swap the handler's stream to a StringIO to capture output, preserving formatter
-        log_buffer = io.StringIO()
-        stream_handler.stream = log_buffer
-
-        try:
-            # Log a test message
-            logger.debug("Test message")
-            log_output = log_buffer.getvalue().strip()
-
-            # Check format
-            self.assertRegex(
-                log_output,
-                r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z \[DEBUG\] netvelocimeter: Test message$",
-            )
-        finally:
-            # Restore the original stream to avoid side effects
-            stream_handler.stream = original_stream
+        logging.getLogger("netvelocimeter").debug("Test message")
+        self.assertRegex(
+            self.log_buffer.getvalue().strip(),
+            r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z \[DEBUG\] netvelocimeter: Test message$",
+        )
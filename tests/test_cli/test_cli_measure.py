@@ -1,67 +1,28 @@
 """Tests for CLI measure command."""
 
 import shutil
-import tempfile
 import unittest
 
-from typer.testing import CliRunner
-
-from netvelocimeter.cli import app
-
-runner = CliRunner()
-
-# The static provider always returns these legal terms
-STATIC_TERMS = r"""
-[
-    {
-        "text": "Test EULA",
-        "category": "eula",
-        "url": "https://example.com/eula"
-    },
-    {
-        "text": "Test Privacy",
-        "category": "privacy",
-        "url": "https://example.com/privacy"
-    },
-    {
-        "text": "Test Terms",
-        "category": "service",
-        "url": "https://example.com/terms"
-    }
-]
-"""
+import pytest
 
 
+@pytest.mark.usefixtures("cli")
 class TestMeasureCommand(unittest.TestCase):
     """Test cases for the CLI measure command."""
 
-    def setUp(self):
-        """Set up the test environment."""
-        # Create a temp config dir for isolation
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path, static_accepted_config):
+        """Set up a test directory private to each test and worker, with all terms accepted."""
+        self.tmp_path = tmp_path
+        self.temp_dir = str(tmp_path / "accepted")
 
-        # Accept all static legal terms so measure can run
-        result = runner.invoke(
-            app,
-            [
-                "--provider=static",
-                "--config-root",
-                self.temp_dir,
-                "legal",
-                "accept",
-            ],
-            input=STATIC_TERMS,
-        )
-        self.assertEqual(result.exit_code, 0)
-
-    def tearDown(self):
-        """Clean up the test environment."""
-        shutil.rmtree(self.temp_dir)
+        # Copy the accepted config so measure can run
+        shutil.copytree(static_accepted_config, self.temp_dir)
 
     def test_measure_run_basic(self):
         """Test measure run with static provider."""
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "--provider=static",
                 "--config-root",
@@ -75,15 +36,15 @@ class TestMeasureCommand(unittest.TestCase):
         self.assertRegex(result.stdout, r"upload_latency:\s+60.00 ms")
         self.assertRegex(result.stdout, r"ping_latency:\s+25.00 ms")
         self.assertRegex(result.stdout, r"packet_loss:\s+1.30 %")
-        self.assertRegex(result.stdout, r"download_speed:")
-        self.assertRegex(result.stdout, r"upload_speed:")
+        self.assertIn("download_speed:", result.stdout)
+        self.assertIn("upload_speed:", result.stdout)
         self.assertRegex(result.stdout, r"server_name:\s+Test Server 1")
 
     def test_measure_run_repeat(self):
         """Test running measure multiple times (should always succeed)."""
         for _ in range(3):
-            result = runner.invoke(
-                app,
+            result = self.runner.invoke(
+                self.app,
                 [
                     "--provider=static",
                     "--config-root",
@@ -97,14 +58,14 @@ class TestMeasureCommand(unittest.TestCase):
 
     def test_measure_run_help(self):
         """Test measure run --help outputs usage."""
-        result = runner.invoke(app, ["measure", "run", "--help"])
+        result = self.runner.invoke(self.app, ["measure", "run", "--help"])
         self.assertEqual(result.exit_code, 0)
-        self.assertRegex(result.stdout, r"Run a measurement(.|\n)+Show this message")
+        self.assertRegex(result.stdout, r"(?s)Run a measurement.+Show this message")
 
     def test_measure_run_with_verbose_verbose(self):
         """Test measure run with verbose verbose verbose (debug) flag."""
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "-vvv",
                 "--provider=static",
@@ -120,25 +81,24 @@ class TestMeasureCommand(unittest.TestCase):
 
     def test_measure_run_without_accepting_terms(self):
         """Test measure run fails if legal terms are not accepted."""
-        # New temp dir, do not accept terms
-        with tempfile.TemporaryDirectory() as temp_dir2:
-            result = runner.invoke(
-                app,
-                [
-                    "--provider=static",
-                    "--config-root",
-                    temp_dir2,
-                    "measure",
-                    "run",
-                ],
-            )
-            self.assertNotEqual(result.exit_code, 0)
-            self.assertIn("must accept all legal terms", str(result.exception).lower())
+        # Separate config dir, do not accept terms
+        result = self.runner.invoke(
+            self.app,
+            [
+                "--provider=static",
+                "--config-root",
+                str(self.tmp_path / "unaccepted"),
+                "measure",
+                "run",
+            ],
+        )
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("must accept all legal terms", str(result.exception).lower())
 
     def test_measure_run_output_contains_server_info(self):
         """Test that server info fields are present in output."""
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "--provider=static",
                 "--config-root",
@@ -147,14 +107,15 @@ class TestMeasureCommand(unittest.TestCase):
                 "run",
             ],
         )
-        self.assertIn("server_name:", result.stdout.lower())
-        self.assertIn("server_host:", result.stdout.lower())
-        self.assertIn("server_country:", result.stdout.lower())
+        stdout = result.stdout.lower()
+        self.assertIn("server_name:", stdout)
+        self.assertIn("server_host:", stdout)
+        self.assertIn("server_country:", stdout)
 
     def test_measure_run_exit_code(self):
         """Test that measure run returns exit code 0 on success."""
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "--provider=static",
                 "--config-root",
@@ -167,8 +128,8 @@ class TestMeasureCommand(unittest.TestCase):
 
     def test_measure_run_with_server_id(self):
         """Test measure run with --server-id parameter."""
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "--provider=static",
                 "--config-root",
@@ -186,8 +147,8 @@ class TestMeasureCommand(unittest.TestCase):
 
     def test_measure_run_with_invalid_server_id(self):
         """Test measure run with invalid --server-id parameter."""
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "--provider=static",
                 "--config-root",
@@ -203,8 +164,8 @@ class TestMeasureCommand(unittest.TestCase):
 
     def test_measure_run_with_server_host(self):
         """Test measure run with --server-host parameter."""
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "--provider=static",
                 "--config-root",
@@ -222,8 +183,8 @@ class TestMeasureCommand(unittest.TestCase):
 
     def test_measure_run_with_invalid_server_host(self):
         """Test measure run with invalid --server-host parameter."""
-        result = runner.invoke(
-            app,
+        result = self.runner.invoke(
+            self.app,
             [
                 "--provider=static",
                 "--config-root",
@@ -4,19 +4,16 @@ import json
 import unittest
 from unittest import mock
 
-from typer.testing import CliRunner
-
-from netvelocimeter.cli import app
-
-runner = CliRunner()
+import pytest
 
 
+@pytest.mark.usefixtures("cli")
 class TestProviderCommand(unittest.TestCase):
     """Test cases for the CLI provider command."""
 
     def test_provider_list_success(self):
         """Test 'provider list' outputs available providers."""
-        result = runner.invoke(app, ["provider", "list"])
+        result = self.runner.invoke(self.app, ["provider", "list"])
         self.assertEqual(result.exit_code, 0)
         # Should contain at least one known provider, e.g. "static"
         self.assertRegex(
@@ -25,7 +22,7 @@ class TestProviderCommand(unittest.TestCase):
 
     def test_provider_list_format_json(self):
         """Test 'provider list' with JSON output format."""
-        result = runner.invoke(app, ["--format", "json", "provider", "list"])
+        result = self.runner.invoke(self.app, ["--format", "json", "provider", "list"])
         self.assertEqual(result.exit_code, 0)
         output = result.stdout.strip()
         self.assertTrue(output.startswith("["))
@@ -45,25 +42,27 @@ class TestProviderCommand(unittest.TestCase):
             )
         )
 
-    def test_provider_list_format_csv(self):
-        """Test 'provider list' with CSV output format."""
-        result = runner.invoke(app, ["--format", "csv", "provider", "list"])
-        self.assertEqual(result.exit_code, 0)
-        self.assertTrue(result.stdout.startswith(r'"name","description"'))
-        self.assertIn(r'"static","Configurable', result.stdout)
-
-    def test_provider_list_format_tsv(self):
-        """Test 'provider list' with TSV output format."""
-        result = runner.invoke(app, ["--format", "tsv", "provider", "list"])
-        self.assertEqual(result.exit_code, 0)
-        self.assertTrue(result.stdout.startswith("name\tdescription"))
-        self.assertIn('static\t"Configurable', result.stdout)
+    def test_provider_list_format_delimited(self):
+        """Test 'provider list' with CSV and TSV output formats."""
+        # output format, header, expected static provider row start
+        cases = [
+            ("csv", '"name","description"', '"static","Configurable'),
+            ("tsv", "name\tdescription", 'static\t"Configurable'),
+        ]
+        for output_format, expect_header, expect_row in cases:
+            with self.subTest(format=output_format):
+                result = self.runner.invoke(
+                    self.app, ["--format", output_format, "provider", "list"]
+                )
+                self.assertEqual(result.exit_code, 0)
+                self.assertTrue(result.stdout.startswith(expect_header))
+                self.assertIn(expect_row, result.stdout)
 
     def test_provider_list_help(self):
         """Test 'provider list --help' outputs usage."""
-        result = runner.invoke(app, ["provider", "list", "--help"])
+        result = self.runner.invoke(self.app, ["provider", "list", "--help"])
         self.assertEqual(result.exit_code, 0)
-        self.assertRegex(result.stdout, r"List all available providers(.|\n)+Show this message")
+        self.assertRegex(result.stdout, r"(?s)List all available providers.+Show this message")
 
     @mock.patch("netvelocimeter.cli.commands.provider.list_providers")
     def test_no_providers(self, mock_list_providers):
@@ -72,6 +71,6 @@ class TestProviderCommand(unittest.TestCase):
         mock_list_providers.return_value = []
 
         # Run the command
-        result = runner.invoke(app, ["provider", "list"])
+        result = self.runner.invoke(self.app, ["provider", "list"])
         self.assertNotEqual(result.exit_code, 0)
         self.assertRegex(result.stderr, r"ERROR.+No matching providers found.")
@@ -1,52 +1,63 @@
 """Tests for CLI server command."""
 
-from tempfile import TemporaryDirectory
 import unittest
 
-from typer.testing import CliRunner
-
-from netvelocimeter.cli import app
-
-runner = CliRunner()
+import pytest
 
 
+@pytest.mark.usefixtures("cli")
 class TestServerCommand(unittest.TestCase):
     """Test cases for the CLI server command."""
 
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        """Set up a clean test directory private to each test and worker."""
+        self.temp_dir = str(tmp_path)
+
+    @pytest.mark.usefixtures("legal_json")
     def test_server_list_success(self):
         """Test 'server list' outputs available servers for static provider."""
-        with TemporaryDirectory() as temp_dir:
-            # get all terms
-            result = runner.invoke(
-                app,
-                ["--config-root", temp_dir, "--format=json", "--provider=static", "legal", "list"],
-            )
-            self.assertEqual(result.exit_code, 0)
-
-            # accept all terms
-            result = runner.invoke(
-                app,
-                ["--config-root", temp_dir, "--provider=static", "legal", "accept"],
-                input=result.stdout,
-            )
-            self.assertEqual(result.exit_code, 0)
-
-            # list servers
-            result = runner.invoke(
-                app, ["--config-root", temp_dir, "--provider=static", "server", "list"]
-            )
-            self.assertEqual(result.exit_code, 0)
-
-            # Should contain all 5 test static servers
-            for i in range(1, 6):
-                self.assertRegex(
-                    result.stdout,
-                    f"name:\\s+Test Server {i}\nid:\\s+{i}\nhost:\\s+test{i}.example.com\n"
-                    f"location:\\s+Test Location {i}\ncountry:\\s+Test Country\n",
-                )
+        # accept all terms
+        result = self.runner.invoke(
+            self.app,
+            ["--config-root", self.temp_dir, "--provider=static", "legal", "accept"],
+            input=self.static_legal_json,
+        )
+        self.assertEqual(result.exit_code, 0)
+
+        # list servers
+        result = self.runner.invoke(
+            self.app, ["--config-root", self.temp_dir, "--provider=static", "server", "list"]
+        )
+        self.assertEqual(result.exit_code, 0)
+
+        # Parse the two-column text once into one dict per server; servers are separated by a blank
+        # line and each line is a "field: value" pair
+        servers = [
+            {
+                field: value.strip()
+                for field, value in (line.split(":", 1) for line in block.splitlines())
+            }
+            for block in result.stdout.strip().split("\n\n")
+        ]
+
+        # Should contain all 5 test static servers
+        self.assertEqual(
+            servers,
+            [
+                {
+                    "name": f"Test Server {i}",
+                    "id": str(i),
+                    "host": f"test{i}.example.com",
+                    "location": f"Test Location {i}",
+                    "country": "Test Country",
+                }
+                for i in range(1, 6)
+            ],
+        )
 
     def test_server_list_help(self):
         """Test 'server list --help' outputs usage."""
-        result = runner.invoke(app, ["server", "list", "--help"])
+        result = self.runner.invoke(self.app, ["server", "list", "--help"])
         self.assertEqual(result.exit_code, 0)
-        self.assertRegex(result.stdout, r"List servers(.|\n)+Show this message")
+        self.assertRegex(result.stdout, r"(?s)List servers.+Show this message")
@@ -2,20 +2,15 @@
 
 import shutil
 import tempfile
+from typing import ClassVar
 from unittest import TestCase, mock
 
 from packaging.version import Version
 
-from netvelocimeter import (
-    NetVelocimeter,
-    get_provider,
-    library_version,
-    list_providers,
-    register_provider,
-)
+from netvelocimeter import NetVelocimeter, get_provider, list_providers, register_provider
 from netvelocimeter.core import _PROVIDERS
 from netvelocimeter.exceptions import LegalAcceptanceError
-from netvelocimeter.legal import LegalTerms, LegalTermsCategory
+from netvelocimeter.legal import LegalTerms, LegalTermsCategory, LegalTermsCollection
 from netvelocimeter.providers.base import BaseProvider, MeasurementResult, ServerIDType
 from netvelocimeter.utils.rates import DataRateMbps
 
@@ -23,10 +18,20 @@ from netvelocimeter.utils.rates import DataRateMbps
 class MockProviderWithTerms(BaseProvider):
     """Mock provider with legal terms."""
 
+    # Version parsed once when the class is defined
+    _VERSION: ClassVar[Version] = Version("2.1.3+g123456")
+
+    # Legal terms built once when the class is defined and shared by all instances
+    _TERMS_COLLECTION: ClassVar[LegalTermsCollection] = [
+        LegalTerms(text="EULA", category=LegalTermsCategory.EULA),
+        LegalTerms(text="TERMS", category=LegalTermsCategory.SERVICE),
+        LegalTerms(text="PRIVACY", category=LegalTermsCategory.PRIVACY),
+    ]
+
     @property
     def _version(self) -> Version:
         """Return a mock version."""
-        return Version("2.1.3+g123456")
+        return self._VERSION
 
     def _measure(
         self, server_id: ServerIDType | None = None, server_host: str | None = None
@@ -36,26 +41,32 @@ class MockProviderWithTerms(BaseProvider):
 
     def _legal_terms(self, categories=LegalTermsCategory.ALL):
         """Return mock legal terms."""
-        corpus = [
-            LegalTerms(text="EULA", category=LegalTermsCategory.EULA),
-            LegalTerms(text="TERMS", category=LegalTermsCategory.SERVICE),
-            LegalTerms(text="PRIVACY", category=LegalTermsCategory.PRIVACY),
-        ]
         if categories == LegalTermsCategory.ALL or LegalTermsCategory.ALL in categories:
-            return corpus
-        return [term for term in corpus if term.category in categories]
+            return self._TERMS_COLLECTION
+        return [term for term in self._TERMS_COLLECTION if term.category in categories]
 
 
 class TestNetVelocimeter(TestCase):
     """Tests for NetVelocimeter class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    # Name the mock provider is registered under for all tests of the class
+    MOCK_PROVIDER = "test_netvelocimeter"
 
-    def tearDown(self):
-        """Clean up after each test."""
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Register the mock provider once for all tests of the class."""
+        register_provider(cls.MOCK_PROVIDER, MockProviderWithTerms)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Unregister the mock provider."""
+        _PROVIDERS.pop(cls.MOCK_PROVIDER, None)
+
+    def _make_temp_dir(self) -> str:
+        """Create a temporary directory that is removed after the test."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        return temp_dir
 
     def test_get_provider(self):
         """Test getting a provider."""
@@ -64,61 +75,53 @@ class TestNetVelocimeter(TestCase):
 
         # Test alias
         provider_class_alias = get_provider("speedtest")
-        self.assertEqual(provider_class, provider_class_alias)
+        self.assertIs(provider_class, provider_class_alias)
 
         # Test case insensitivity
         provider_class_case = get_provider("OoKlA")
-        self.assertEqual(provider_class, provider_class_case)
+        self.assertIs(provider_class, provider_class_case)
 
     def test_get_provider_with_nonexistent_name(self):
         """Test getting an invalid provider."""
-        with self.assertRaises(ValueError):
+        with self.assertRaises(ValueError) as context:
             get_provider("nonexistent")
+        self.assertIn("not found", str(context.exception))
+
+        # Invalid names are still reported as invalid
+        with self.assertRaises(ValueError) as context:
+            get_provider("invalid name")
+        self.assertIn("Must be a valid Python identifier", str(context.exception))
 
     def test_list_providers(self):
         """Test listing available providers."""
         # Get the list of providers
         providers = list_providers()
 
-        # Check it's a list of provider info objects
+        # Check it's a list of provider info objects, including the built-in providers
         self.assertIsInstance(providers, list)
-        self.assertTrue(
-            all(
-                hasattr(provider, "name") and hasattr(provider, "description")
-                for provider in providers
-            )
-        )
-
-        # Check expected providers exist
-        provider_names = [provider.name for provider in providers]
+        provider_names = {provider.name for provider in providers}
         self.assertIn("ookla", provider_names)
         self.assertIn("static", provider_names)
 
-        # Check descriptions are lists of non-empty strings
+        # Check each description is a list of the non-empty, stripped lines of its docstring
         for provider in providers:
-            self.assertIsInstance(provider.description, list)
-
-            # Each line should be a non-empty string
-            self.assertTrue(
-                all(
-                    isinstance(line, str) and line.strip() == line and line
-                    for line in provider.description
-                )
-            )
-
-        # Test each provider's docstring is properly processed
-        # Get the raw providers
-        provider_classes = {name: get_provider(name) for name in provider_names}
+            with self.subTest(provider=provider.name):
+                expected_description = [
+                    stripped_line
+                    for line in get_provider(provider.name).__doc__.splitlines()
+                    if (stripped_line := line.strip())
+                ]
+                self.assertIsInstance(provider.description, list)
+                self.assertEqual(provider.description, expected_description)
+
+    def test_list_providers_cached_descriptions(self):
+        """Test repeated listing reuses parsed descriptions but returns independent lists."""
+        providers = list_providers()
+        original = list(providers[0].description)
+        providers[0].description.append("changed by caller")
 
-        # Check each provider's description matches its processed docstring
-        for provider in providers:
-            provider_class = provider_classes[provider.name]
-            expected_description = [
-                stripped_line
-                for line in provider_class.__doc__.splitlines()
-                if (stripped_line := line.strip())
-            ]
-            self.assertEqual(provider.description, expected_description)
+        # Changes to a returned description do not leak into later listings
+        self.assertEqual(list_providers()[0].description, original)
 
     def test_initialize_with_unknown_parameter(self):
         """Test initializing with an unknown parameter logs a debug message."""
@@ -131,77 +134,42 @@ class TestNetVelocimeter(TestCase):
         self.assertIn("does not support parameters", log.output[0])
         self.assertIn("unknown_param", log.output[0])
 
-    def test_provider_version_access(self):
-        """Test accessing provider version."""
-        # Mock the get_provider function instead of the OoklaProvider directly
-        with mock.patch("netvelocimeter.core.get_provider") as mock_get_provider:
-            # Create a mock provider class and instance
-            mock_instance = mock.MagicMock()
-            mock_instance._version = Version("1.2.3")
-            mock_provider_class = mock.MagicMock(return_value=mock_instance)
-
-            # Set up get_provider to return our mock provider class
-            mock_get_provider.return_value = mock_provider_class
-
-            nv = NetVelocimeter()
-            self.assertEqual(nv.version, Version("1.2.3"))
-
     def test_netvelocimeter_legal_terms(self):
         """Test NetVelocimeter legal_terms method."""
-        with mock.patch("netvelocimeter.core.get_provider") as mock_get_provider:
-            # Create a mock provider class
-            mock_get_provider.return_value = MockProviderWithTerms
-
-            # Create NetVelocimeter instance
-            nv = NetVelocimeter()
+        # Create NetVelocimeter instance
+        nv = NetVelocimeter(provider=self.MOCK_PROVIDER)
 
-            # Test getting all terms
-            terms = nv.legal_terms()
-            self.assertEqual(len(terms), 3)
+        # Test getting all terms
+        terms = nv.legal_terms()
+        self.assertEqual(len(terms), 3)
 
-            # Test getting specific category
-            eula_terms = nv.legal_terms(categories=LegalTermsCategory.EULA)
-            self.assertEqual(len(eula_terms), 1)
-            self.assertEqual(eula_terms[0].text, "EULA")
+        # Test getting specific category
+        eula_terms = nv.legal_terms(categories=LegalTermsCategory.EULA)
+        self.assertEqual(len(eula_terms), 1)
+        self.assertEqual(eula_terms[0].text, "EULA")
 
     def test_netvelocimeter_name(self):
         """Test NetVelocimeter name property."""
-        # register a mock provider
-        register_provider("test_netvelocimeter_name", MockProviderWithTerms)
-
         # Create NetVelocimeter instance
-        nv = NetVelocimeter(provider="test_netvelocimeter_name")
+        nv = NetVelocimeter(provider=self.MOCK_PROVIDER)
 
         # Test name property
-        self.assertEqual(nv.name, "test_netvelocimeter_name")
+        self.assertEqual(nv.name, self.MOCK_PROVIDER)
 
     def test_netvelocimeter_description(self):
         """Test NetVelocimeter description property."""
-        # register a mock provider
-        register_provider("test_netvelocimeter_description", MockProviderWithTerms)
-
         # Create NetVelocimeter instance
-        nv = NetVelocimeter(provider="test_netvelocimeter_description")
+        nv = NetVelocimeter(provider=self.MOCK_PROVIDER)
 
         # Test description property
         self.assertIsInstance(nv.description, list)
         self.assertTrue(all(isinstance(line, str) and line.strip() for line in nv.description))
         self.assertEqual(nv.description[0], "Mock provider with legal terms.")
 
-    def test_netvelocimeter_library_version_as_version_object(self):
-        """Test NetVelocimeter library version as Version object."""
-        # Test library version property
-        from netvelocimeter import __version__
-
-        self.assertEqual(library_version(), Version(__version__))
-
     def test_netvelocimeter_servers(self):
         """Test NetVelocimeter servers property."""
-        # register a mock provider
-        register_provider("test_netvelocimeter_servers", MockProviderWithTerms)
-
         # Create NetVelocimeter instance
-        nv = NetVelocimeter(provider="test_netvelocimeter_servers", config_root=self.temp_dir)
+        nv = NetVelocimeter(provider=self.MOCK_PROVIDER, config_root=self._make_temp_dir())
 
         # Test servers property
         with self.assertRaises(LegalAcceptanceError):
@@ -216,11 +184,8 @@ class TestNetVelocimeter(TestCase):
 
     def test_netvelocimeter_measure(self):
         """Test NetVelocimeter measure method."""
-        # register a mock provider
-        register_provider("test_netvelocimeter_measure", MockProviderWithTerms)
-
         # Create NetVelocimeter instance
-        nv = NetVelocimeter(provider="test_netvelocimeter_measure", config_root=self.temp_dir)
+        nv = NetVelocimeter(provider=self.MOCK_PROVIDER, config_root=self._make_temp_dir())
 
         # Test measure method without accepting terms
         with self.assertRaises(LegalAcceptanceError):
@@ -233,143 +198,144 @@ class TestNetVelocimeter(TestCase):
         with self.assertRaises(ValueError):
             _ = nv.measure(server_id="12345", server_host="test.server.com")
 
-        # Test measure method with no parameters
-        result = nv.measure()
-        self.assertIsInstance(result, MeasurementResult)
-        self.assertEqual(result.download_speed, 1.0)
-        self.assertEqual(result.upload_speed, 1.0)
-
-        # Test measure method with specific server
-        result = nv.measure(server_id=1)
-        self.assertIsInstance(result, MeasurementResult)
-        self.assertEqual(result.download_speed, 1.0)
-        self.assertEqual(result.upload_speed, 1.0)
-
-        # Test measure method with specific server host
-        result = nv.measure(server_host="test.server.com")
-        self.assertIsInstance(result, MeasurementResult)
-        self.assertEqual(result.download_speed, 1.0)
-        self.assertEqual(result.upload_speed, 1.0)
+        # Test measure method with no parameters, specific server, and specific server host
+        for kwargs in ({}, {"server_id": 1}, {"server_host": "test.server.com"}):
+            with self.subTest(**kwargs):
+                result = nv.measure(**kwargs)
+                self.assertIsInstance(result, MeasurementResult)
+                self.assertEqual(result.download_speed, 1.0)
+                self.assertEqual(result.upload_speed, 1.0)
 
 
 class TestProviderRegistration(TestCase):
     """Test the provider-related functions."""
 
-    def test_register_custom_provider(self):
-        """Test registering a custom provider."""
+    def _patch_discovery(self, **kwargs):
+        """Patch an empty private registry, not yet discovered, with mocked discovery.
+
+        Args:
+            kwargs: Keyword arguments for the mock of `_discover_providers`
+
+        Returns:
+            The mock of `_discover_providers`
+        """
+        for patcher in (
+            mock.patch("netvelocimeter.core._PROVIDERS", {}),
+            mock.patch("netvelocimeter.core._discovered", False),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch("netvelocimeter.core._discover_providers", **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_discovery_on_first_lookup(self):
+        """Test built-in providers are discovered once, on first lookup."""
+        mock_discover = self._patch_discovery()
+
+        # First lookup discovers, later lookups do not
+        with self.assertRaises(ValueError):
+            get_provider("test_discovery_on_first_lookup")
+        list_providers()
+        mock_discover.assert_called_once_with()
 
-        # Create a test provider class
-        class TestProvider(BaseProvider):
-            """Test provider for unit tests."""
+    def test_discovery_on_first_registration(self):
+        """Test built-in providers are discovered before the first registration."""
 
-            @property
-            def _version(self) -> Version:
-                """Return a mock version."""
-                return Version("1.0.0")
+        def discover():
+            register_provider("ookla", MockProviderWithTerms)
+            register_provider("static", MockProviderWithTerms)
 
-            def _legal_terms(self, categories=LegalTermsCategory.ALL):
-                """Return mock legal terms."""
-                return []
+        mock_discover = self._patch_discovery(side_effect=discover)
 
-            def _measure(self, server_id=None, server_host=None):
-                return MeasurementResult(download_speed=1.0, upload_speed=1.0)
+        # A name clashing with a built-in fails at its own registration
+        class ClashingProvider(MockProviderWithTerms):
+            """Provider clashing with a built-in provider name."""
 
-        # Register it
-        register_provider("test_register_custom_provider", TestProvider)
+        with self.assertRaises(ValueError) as context:
+            register_provider("ookla", ClashingProvider)
+        self.assertIn("already registered", str(context.exception))
 
+        # Built-in providers remain available and discovery ran once
+        register_provider("test_discovery_on_first_registration", ClashingProvider)
+        self.assertIs(get_provider("ookla"), MockProviderWithTerms)
+        self.assertIs(get_provider("static"), MockProviderWithTerms)
+        mock_discover.assert_called_once_with()
+
+    def test_discovery_retried_after_failure(self):
+        """Test discovery that fails is retried on the next use of the registry."""
+        mock_discover = self._patch_discovery(side_effect=[ImportError("broken provider"), None])
+
+        with self.assertRaises(ImportError):
+            list_providers()
+        list_providers()
+        self.assertEqual(mock_discover.call_count, 2)
+
+    def _assert_registered(
+        self, name: str, provider_class: type[BaseProvider], expected_description: list[str]
+    ) -> None:
+        """Assert a registered provider can be looked up and listed with its description.
+
+        Args:
+            name: Name the provider was registered under
+            provider_class: Provider class that was registered
+            expected_description: Non-empty, stripped lines expected from the class docstring
+        """
         # Should be available via get_provider
-        provider_class = get_provider("test_register_custom_provider")
-        self.assertEqual(provider_class, TestProvider)
+        self.assertIs(get_provider(name), provider_class)
 
         # Should appear in list_providers
         providers = list_providers()
-        provider_names = [provider.name for provider in providers]
-        self.assertIn("test_register_custom_provider", provider_names)
-
-        # Find this provider's info
-        provider_info = next(p for p in providers if p.name == "test_register_custom_provider")
+        provider_info = next(p for p in providers if p.name == name)
 
-        # Check description is a list of non-empty strings
+        # Description is a list of the docstring's non-empty lines
         self.assertIsInstance(provider_info.description, list)
-        self.assertTrue(
-            all(isinstance(line, str) and line.strip() for line in provider_info.description)
-        )
+        self.assertEqual(provider_info.description, expected_description)
+
+    def test_register_custom_provider(self):
+        """Test registering a custom provider."""
+
+        # Create a test provider class
+        class TestProvider(MockProviderWithTerms):
+            """Test provider for unit tests."""
 
-        # Check first line matches first non-empty line of docstring
-        self.assertEqual(len(provider_info.description), 1)
-        self.assertEqual(provider_info.description[0], "Test provider for unit tests.")
+        register_provider("test_register_custom_provider", TestProvider)
+        self._assert_registered(
+            "test_register_custom_provider", TestProvider, ["Test provider for unit tests."]
+        )
 
     def test_register_custom_provider_multiline_doc(self):
         """Test registering a custom provider."""
 
         # Create an actual test provider class instead of a mock instance
-        class TestMockProvider(BaseProvider):
+        class TestMockProvider(MockProviderWithTerms):
             """Test provider for unit tests.
 
             The first line of this __doc__ is an empty line.
             This test ensures registration works with multiline docstrings.
             """
 
-            @property
-            def _version(self) -> Version:
-                """Return a mock version."""
-                return Version("1.0.0")
-
-            def _legal_terms(self, categories=LegalTermsCategory.ALL):
-                """Return mock legal terms."""
-                return []
-
-            def _measure(self, server_id=None, server_host=None):
-                return MeasurementResult(download_speed=1.0, upload_speed=1.0)
-
-        # Register it
         register_provider("test_register_custom_provider_multiline_doc", TestMockProvider)
-
-        # Should be available via get_provider
-        provider_class = get_provider("test_register_custom_provider_multiline_doc")
-        self.assertEqual(provider_class, TestMockProvider)
-
-        # Should appear in list_providers
-        providers = list_providers()
-        provider_names = [provider.name for provider in providers]
-        self.assertIn("test_register_custom_provider_multiline_doc", provider_names)
-
-        # Find this provider's info
-        provider_info = next(
-            p for p in providers if p.name == "test_register_custom_provider_multiline_doc"
-        )
-
-        # Check description is a list of non-empty strings
-        self.assertIsInstance(provider_info.description, list)
-        self.assertTrue(
-            all(isinstance(line, str) and line.strip() for line in provider_info.description)
+        self._assert_registered(
+            "test_register_custom_provider_multiline_doc",
+            TestMockProvider,
+            [
+                "Test provider for unit tests.",
+                "The first line of this __doc__ is an empty line.",
+                "This test ensures registration works with multiline docstrings.",
+            ],
         )
 
-        # Check first line matches first non-empty line of docstring
-        self.assertEqual(provider_info.description[0], "Test provider for unit tests.")
-
-        # Check that all expected lines are included
-        expected_lines = [
-            "Test provider for unit tests.",
-            "The first line of this __doc__ is an empty line.",
-            "This test ensures registration works with multiline docstrings.",
-        ]
-        self.assertEqual(provider_info.description, expected_lines)
-
 
 class TestProviderRegistrationErrors(TestCase):
     """Test error scenarios for provider registration."""
 
     def setUp(self):
         """Set up test environment."""
-        # Save original providers to restore after test
-        self._original_providers = _PROVIDERS.copy()
-
-    def tearDown(self):
-        """Clean up test environment."""
-        # Restore original providers
-        _PROVIDERS.clear()
-        _PROVIDERS.update(self._original_providers)
+        # Register into a private copy of the providers, the original is rebound after the test
+        patcher = mock.patch("netvelocimeter.core._PROVIDERS", dict(_PROVIDERS))
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_register_non_provider_class(self):
         """Test registering a class that doesn't inherit from BaseProvider."""
@@ -399,21 +365,9 @@ class TestProviderRegistrationErrors(TestCase):
         """Test registering a provider with a name already in use."""
 
         # Create a valid provider class
-        class TestProvider(BaseProvider):
+        class TestProvider(MockProviderWithTerms):
             """Test provider for duplicates."""
 
-            @property
-            def _version(self) -> Version:
-                """Return a mock version."""
-                return Version("1.0.0")
-
-            def _legal_terms(self, categories=LegalTermsCategory.ALL):
-                """Return mock legal terms."""
-                return []
-
-            def _measure(self, server_id=None, server_host=None):
-                pass
-
         # Register first time - should succeed
         register_provider("test_register_duplicate_provider", TestProvider)
 
@@ -433,56 +387,21 @@ class TestProviderRegistrationErrors(TestCase):
         """Test registering a provider with an invalid name."""
 
         # Create a valid provider class
-        class TestProvider(BaseProvider):
+        class TestProvider(MockProviderWithTerms):
             """Test provider with invalid name."""
 
-            @property
-            def _version(self) -> Version:
-                """Return a mock version."""
-                return Version("1.0.0")
-
-            def _legal_terms(self, categories=LegalTermsCategory.ALL):
-                """Return mock legal terms."""
-                return []
-
-            def _measure(self, server_id=None, server_host=None):
-                pass
-
-        # Test with invalid identifier (contains spaces)
-        with self.assertRaises(ValueError) as context:
-            register_provider("invalid name", TestProvider)
-
-        self.assertIn("Must be a valid Python identifier", str(context.exception))
-
-        # Test with invalid identifier (starts with number)
-        with self.assertRaises(ValueError) as context:
-            register_provider("123invalid", TestProvider)
-
-        self.assertIn("Must be a valid Python identifier", str(context.exception))
-
-        # Test with invalid identifier (contains special chars)
-        with self.assertRaises(ValueError) as context:
-            register_provider("invalid@name", TestProvider)
-
-        self.assertIn("Must be a valid Python identifier", str(context.exception))
+        # Invalid identifiers: contains spaces, starts with number, contains special chars
+        for name in ("invalid name", "123invalid", "invalid@name"):
+            with self.subTest(name=name), self.assertRaises(ValueError) as context:
+                register_provider(name, TestProvider)
+            self.assertIn("Must be a valid Python identifier", str(context.exception))
 
     def test_register_without_docstring(self):
         """Test registering a provider class without a docstring."""
 
-        # Create a provider class without a docstring
-        class TestProviderNoDoc(BaseProvider):
-            @property
-            def _version(self) -> Version:
-                """Mock version."""
-                return Version("1.0.0")
-
-            def _legal_terms(self, categories=LegalTermsCategory.ALL):
-                """Mock legal terms."""
-                return []
-
-            def _measure(self, server_id=None, server_host=None):
-                """Mock measurement."""
-                pass
+        # Create a provider class without a docstring, docstrings are not inherited
+        class TestProviderNoDoc(MockProviderWithTerms):
+            pass
 
         # Should raise ValueError
         with self.assertRaises(ValueError) as context:
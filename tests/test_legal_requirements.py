@@ -1,10 +1,10 @@
 """Test legal requirements functionality."""
 
 from datetime import timedelta
+import os
 import shutil
 import tempfile
 import unittest
-from unittest import mock
 
 from netvelocimeter import NetVelocimeter
 from netvelocimeter.exceptions import LegalAcceptanceError
@@ -15,33 +15,34 @@ from netvelocimeter.providers.static import StaticProvider
 class TestLegalRequirements(unittest.TestCase):
     """Test legal requirements functionality."""
 
-    def setUp(self):
-        """Set up a clean test directory."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create one base directory for all tests of the class."""
+        cls._base_dir = tempfile.mkdtemp()
 
-    def tearDown(self):
-        """Clean up test directory."""
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the base directory and every test directory within it."""
+        shutil.rmtree(cls._base_dir, ignore_errors=True)
 
-    @mock.patch("netvelocimeter.core.get_provider")
-    def test_default_no_acceptance(self, mock_get_provider):
-        """Test that measurements fail without legal acceptance."""
-        mock_get_provider.return_value = StaticProvider
+    def setUp(self):
+        """Set up a clean test directory, named for the test within the base directory."""
+        self.temp_dir = os.path.join(self._base_dir, self._testMethodName)
+        os.mkdir(self.temp_dir)
 
+    def test_default_no_acceptance(self):
+        """Test that measurements fail without legal acceptance."""
         # Create NetVelocimeter without accepting terms
-        nv = NetVelocimeter(config_root=self.temp_dir)
+        nv = NetVelocimeter(provider="static", config_root=self.temp_dir)
 
         # Verify that measurement fails without accepting terms
         with self.assertRaises(LegalAcceptanceError):
             nv.measure()
 
-    @mock.patch("netvelocimeter.core.get_provider")
-    def test_partial_acceptance_fails(self, mock_get_provider):
+    def test_partial_acceptance_fails(self):
         """Test that partial acceptance fails."""
-        mock_get_provider.return_value = StaticProvider
-
         # Create NetVelocimeter
-        nv = NetVelocimeter(config_root=self.temp_dir)
+        nv = NetVelocimeter(provider="static", config_root=self.temp_dir)
 
         # Only accept EULA terms
         eula_terms = nv.legal_terms(categories=LegalTermsCategory.EULA)
@@ -52,7 +53,7 @@ class TestLegalRequirements(unittest.TestCase):
             nv.measure()
 
         # Create fresh instance and accept EULA and Service terms but not Privacy
-        nv2 = NetVelocimeter(config_root=self.temp_dir)
+        nv2 = NetVelocimeter(provider="static", config_root=self.temp_dir)
         nv2.accept_terms(nv2.legal_terms(categories=LegalTermsCategory.EULA))
         nv2.accept_terms(nv2.legal_terms(categories=LegalTermsCategory.SERVICE))
 
@@ -60,13 +61,10 @@ class TestLegalRequirements(unittest.TestCase):
         with self.assertRaises(LegalAcceptanceError):
             nv2.measure()
 
-    @mock.patch("netvelocimeter.core.get_provider")
-    def test_full_acceptance_succeeds(self, mock_get_provider):
+    def test_full_acceptance_succeeds(self):
         """Test that full acceptance allows measurements."""
-        mock_get_provider.return_value = StaticProvider
-
         # Create NetVelocimeter
-        nv = NetVelocimeter(config_root=self.temp_dir)
+        nv = NetVelocimeter(provider="static", config_root=self.temp_dir)
 
         # Accept all terms
         nv.accept_terms(nv.legal_terms())
@@ -77,12 +75,9 @@ class TestLegalRequirements(unittest.TestCase):
         self.assertEqual(result.upload_speed, 50.0)
         self.assertEqual(result.ping_latency, timedelta(milliseconds=25.0))
 
-    @mock.patch("netvelocimeter.core.get_provider")
-    def test_legal_terms_retrieval(self, mock_get_provider):
+    def test_legal_terms_retrieval(self):
         """Test retrieving legal terms."""
-        mock_get_provider.return_value = StaticProvider
-
-        nv = NetVelocimeter(config_root=self.temp_dir)
+        nv = NetVelocimeter(provider="static", config_root=self.temp_dir)
         terms = nv.legal_terms()
 
         # Check that we have terms
@@ -120,17 +115,14 @@ class TestLegalRequirements(unittest.TestCase):
                 self.assertEqual(term.url, "https://example.com/eula")
                 self.assertEqual(term.text, "Test EULA")
 
-    @mock.patch("netvelocimeter.core.get_provider")
-    def test_has_accepted_terms(self, mock_get_provider):
+    def test_has_accepted_terms(self):
         """Test checking acceptance status."""
-        mock_get_provider.return_value = StaticProvider
-
         # No acceptance
-        nv = NetVelocimeter(config_root=self.temp_dir)
+        nv = NetVelocimeter(provider="static", config_root=self.temp_dir)
         self.assertFalse(nv.has_accepted_terms())
 
         # Partial acceptance
-        nv = NetVelocimeter(config_root=self.temp_dir)
+        nv = NetVelocimeter(provider="static", config_root=self.temp_dir)
         nv.accept_terms(nv.legal_terms(categories=LegalTermsCategory.EULA))
         self.assertFalse(nv.has_accepted_terms())  # Should be false for all terms
         self.assertTrue(
@@ -138,7 +130,7 @@ class TestLegalRequirements(unittest.TestCase):
         )  # But true for just EULA
 
         # Full acceptance
-        nv = NetVelocimeter(config_root=self.temp_dir)
+        nv = NetVelocimeter(provider="static", config_root=self.temp_dir)
         nv.accept_terms(nv.legal_terms())
         self.assertTrue(nv.has_accepted_terms())
 
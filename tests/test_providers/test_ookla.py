@@ -865,7 +865,7 @@ class TestNetworkHandling(unittest.TestCase):
         """Clean up test directory."""
         shutil.rmtree(self.temp_dir)
 
-    @mock.patch("netvelocimeter.utils.binary_manager.urllib.request.urlopen")
+    @mock.patch("urllib.request.urlopen")
     def test_network_errors(self, mock_urlopen):
         """Test handling of network errors."""
         mock_urlopen.side_effect = URLError("Network unreachable")
@@ -32,6 +32,9 @@ class TestLegalTerms(unittest.TestCase):
         self.assertNotEqual(term1.unique_id(), term3.unique_id())
         self.assertNotEqual(term1.unique_id(), term4.unique_id())
 
+        # Ids of persisted acceptances must be stable
+        self.assertEqual(term1.unique_id(), "1/3ThJvEEwqiAWonE6_Ow_lE")
+
     def test_invalid_methodology_version(self):
         """Test invalid methodology version raises ValueError."""
         term = LegalTerms(text="Test", category=LegalTermsCategory.EULA)
@@ -1,6 +1,8 @@
 """Tests for binary_manager.py utilities."""
 
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from io import BytesIO
 import os
 import platform
@@ -8,9 +10,11 @@ import shutil
 import stat
 import tarfile
 import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
 import zipfile
 
 from packaging.version import Version
@@ -18,10 +22,12 @@ import pytest
 
 from netvelocimeter.exceptions import PlatformNotSupported
 from netvelocimeter.providers.base import BaseProvider
+from netvelocimeter.utils import binary_manager
 from netvelocimeter.utils.binary_manager import (
     BinaryManager,
     BinaryMeta,
     download_file,
+    download_file_parallel,
     ensure_executable,
     extract_file,
     select_platform_binary,
@@ -47,7 +53,8 @@ class TestBinaryManagerFunctions(unittest.TestCase):
         """Test downloading a file successfully."""
         # Setup mock
         mock_response = mock.MagicMock()
-        mock_response.read.return_value = b"test file content"
+        mock_response.headers = {"ETag": '"v1"'}
+        mock_response.read.side_effect = BytesIO(b"test file content").read
         mock_urlopen.return_value.__enter__.return_value = mock_response
 
         # Test
@@ -55,9 +62,329 @@ class TestBinaryManagerFunctions(unittest.TestCase):
         destination = os.path.join(self.temp_dir, "downloads", "testfile.zip")
         download_file(url, destination)
 
-        # Verify
-        mock_urlopen.assert_called_once_with(url)
+        # Verify a full download without a range request
+        mock_urlopen.assert_called_once()
+        request = mock_urlopen.call_args.args[0]
+        self.assertEqual(request.full_url, url)
+        self.assertFalse(request.has_header("Range"))
         self.assertTrue(os.path.exists(destination))
+        self.assertFalse(os.path.exists(destination + ".part"))
+        self.assertFalse(os.path.exists(destination + ".part.validator"))
+        with open(destination, "rb") as f:
+            self.assertEqual(f.read(), b"test file content")
+
+    @mock.patch("urllib.request.urlopen")
+    def test_download_file_resume(self, mock_urlopen):
+        """Test resuming an interrupted download with a range request."""
+        # Setup mock with a server that supports range requests
+        mock_response = mock.MagicMock()
+        mock_response.status = 206
+        mock_response.headers = {"Content-Range": "bytes 9-16/17"}
+        mock_response.read.side_effect = BytesIO(b" content").read
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        # Create a partial download and its validator
+        url = "https://example.com/testfile.zip"
+        destination = os.path.join(self.temp_dir, "testfile.zip")
+        with open(destination + ".part", "wb") as f:
+            f.write(b"test file")
+        with open(destination + ".part.validator", "w") as f:
+            f.write('"v1"')
+
+        # Test
+        download_file(url, destination)
+
+        # Verify only the missing bytes of the unchanged file were requested and appended
+        request = mock_urlopen.call_args.args[0]
+        self.assertEqual(request.get_header("Range"), "bytes=9-")
+        self.assertEqual(request.get_header("If-range"), '"v1"')
+        self.assertFalse(os.path.exists(destination + ".part.validator"))
+        self.assertFalse(os.path.exists(destination + ".part"))
+        with open(destination, "rb") as f:
+            self.assertEqual(f.read(), b"test file content")
+
+    @mock.patch("urllib.request.urlopen")
+    def test_download_file_resume_unsupported(self, mock_urlopen):
+        """Test restarting an interrupted download when the server ignores range requests."""
+        # Setup mock with a server that sends the whole file
+        mock_response = mock.MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read.side_effect = BytesIO(b"test file content").read
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        # Create a partial download and its validator
+        url = "https://example.com/testfile.zip"
+        destination = os.path.join(self.temp_dir, "testfile.zip")
+        with open(destination + ".part", "wb") as f:
+            f.write(b"stale")
+        with open(destination + ".part.validator", "w") as f:
+            f.write('"v1"')
+
+        # Test
+        download_file(url, destination)
+
+        # Verify the partial download was replaced
+        with open(destination, "rb") as f:
+            self.assertEqual(f.read(), b"test file content")
+
+    @mock.patch("netvelocimeter.utils.binary_manager._PARALLEL_MIN_SIZE", 4)
+    @mock.patch("urllib.request.urlopen")
+    def test_download_file_parallel(self, mock_urlopen):
+        """Test downloading byte ranges of a file in parallel from mirrors."""
+        content = b"0123456789abcdefghij"
+
+        # Fake server which answers HEAD and range requests for the content
+        def fake_urlopen(request):
+            response = mock.MagicMock()
+            if request.get_method() == "HEAD":
+                response.headers = {"Content-Length": str(len(content)), "Accept-Ranges": "bytes"}
+            else:
+                start, end = map(int, request.get_header("Range")[6:].split("-"))
+                response.status = 206
+                response.read.side_effect = BytesIO(content[start : end + 1]).read
+            cm = mock.MagicMock()
+            cm.__enter__.return_value = response
+            return cm
+
+        mock_urlopen.side_effect = fake_urlopen
+
+        # Test
+        urls = ["https://example.com/testfile.zip", "https://mirror.example.com/testfile.zip"]
+        destination = os.path.join(self.temp_dir, "testfile.zip")
+        result = download_file_parallel(urls, destination, parts=3)
+
+        # Verify all ranges were requested and spread across mirrors
+        range_requests = [
+            c.args[0] for c in mock_urlopen.call_args_list if c.args[0].get_method() == "GET"
+        ]
+        self.assertEqual(
+            sorted(r.get_header("Range") for r in range_requests),
+            ["bytes=0-6", "bytes=14-19", "bytes=7-13"],
+        )
+        self.assertEqual({r.full_url for r in range_requests}, set(urls))
+        self.assertEqual(result, os.path.abspath(destination))
+        self.assertFalse(os.path.exists(destination + ".part"))
+        with open(destination, "rb") as f:
+            self.assertEqual(f.read(), content)
+
+    @mock.patch("netvelocimeter.utils.binary_manager._PARALLEL_MIN_SIZE", 4)
+    @mock.patch("urllib.request.urlopen")
+    def test_download_file_parallel_mirror_retry(self, mock_urlopen):
+        """Test retrying the ranges of a failed mirror from the other urls."""
+        content = b"0123456789abcdefghij"
+        urls = ["https://example.com/testfile.zip", "https://mirror.example.com/testfile.zip"]
+
+        # Fake server which answers HEAD and range requests for the content, except the mirror
+        def fake_urlopen(request):
+            if request.full_url == urls[1]:
+                raise URLError("Network error")
+            response = mock.MagicMock()
+            if request.get_method() == "HEAD":
+                response.headers = {"Content-Length": str(len(content)), "Accept-Ranges": "bytes"}
+            else:
+                start, end = map(int, request.get_header("Range")[6:].split("-"))
+                response.status = 206
+                response.read.side_effect = BytesIO(content[start : end + 1]).read
+            cm = mock.MagicMock()
+            cm.__enter__.return_value = response
+            return cm
+
+        mock_urlopen.side_effect = fake_urlopen
+
+        # Test
+        destination = os.path.join(self.temp_dir, "testfile.zip")
+        download_file_parallel(urls, destination, parts=3)
+
+        # Verify the mirror's range was downloaded from the first url
+        mirror_ranges = [
+            c.args[0].get_header("Range")
+            for c in mock_urlopen.call_args_list
+            if c.args[0].full_url == urls[1]
+        ]
+        self.assertEqual(mirror_ranges, ["bytes=7-13"])
+        with open(destination, "rb") as f:
+            self.assertEqual(f.read(), content)
+
+    @mock.patch("netvelocimeter.utils.binary_manager._PARALLEL_MIN_SIZE", 4)
+    @mock.patch("netvelocimeter.utils.binary_manager.download_file")
+    @mock.patch("urllib.request.urlopen")
+    def test_download_file_parallel_fallback(self, mock_urlopen, mock_download_file):
+        """Test falling back to a sequential download when ranges can not be downloaded."""
+        size = {"Content-Length": "20"}
+        ranges = {"Content-Length": "20", "Accept-Ranges": "bytes"}
+
+        # Each case has the HEAD response headers or error, and the range response status or error
+        cases = [
+            ("HEAD rejected", HTTPError("url", 405, "Method Not Allowed", {}, None), None),
+            ("ranges not accepted", size, None),
+            ("ranges ignored", ranges, 200),
+            ("ranges failed", ranges, URLError("Network error")),
+        ]
+        urls = ["https://example.com/testfile.zip", "https://mirror.example.com/testfile.zip"]
+        destination = os.path.join(self.temp_dir, "testfile.zip")
+        mock_download_file.return_value = "/downloaded"
+        for name, head, ranged in cases:
+            with self.subTest(name):
+                mock_urlopen.reset_mock()
+                mock_download_file.reset_mock()
+
+                # Fake server which answers HEAD and range requests as the case describes
+                def fake_urlopen(request, head=head, ranged=ranged):
+                    result = head if request.get_method() == "HEAD" else ranged
+                    if isinstance(result, Exception):
+                        raise result
+                    response = mock.MagicMock()
+                    response.headers = result
+                    response.status = result
+                    cm = mock.MagicMock()
+                    cm.__enter__.return_value = response
+                    return cm
+
+                mock_urlopen.side_effect = fake_urlopen
+
+                # Test
+                result = download_file_parallel(urls, destination)
+
+                # Verify the first url was downloaded sequentially without a partial file
+                mock_download_file.assert_called_once_with(url=urls[0], dest_filepath=destination)
+                self.assertEqual(result, "/downloaded")
+                self.assertFalse(os.path.exists(destination + ".part"))
+
+        # Verify no urls is an error
+        with self.assertRaises(ValueError):
+            download_file_parallel([], destination)
+
+    def _serve(self, content: bytes, etag: str = '"v1"') -> str:
+        """Serve content from a local plain http server which honors byte range requests.
+
+        Args:
+            content: Body of the served file.
+            etag: ETag of the served file, a range request with another If-Range is ignored.
+
+        Returns:
+            URL of the served file.
+        """
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                # honor an open-ended byte range request, e.g. "bytes=9-", for an unchanged file
+                start = 0
+                range_header = self.headers.get("Range")
+                if range_header and self.headers.get("If-Range", etag) == etag:
+                    start = int(range_header.removeprefix("bytes=").split("-")[0])
+                    if start >= len(content):
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{len(content)}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header(
+                        "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+                    )
+                else:
+                    self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(content) - start))
+                self.end_headers()
+                self.wfile.write(content[start:])
+
+            def log_message(self, format, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_port}/testfile.zip"
+
+    @unittest.skipUnless(hasattr(os, "splice"), "os.splice is only available on Linux")
+    def test_download_file_splice(self):
+        """Test a plain http download is spliced from the socket to the file."""
+        content = os.urandom(3 * 1024 * 1024 + 7)
+        url = self._serve(content)
+
+        # Test
+        destination = os.path.join(self.temp_dir, "testfile.zip")
+        with mock.patch("os.splice", wraps=os.splice) as mock_splice:
+            download_file(url, destination)
+
+        # Verify the body was spliced and written intact
+        mock_splice.assert_called()
+        with open(destination, "rb") as f:
+            self.assertEqual(f.read(), content)
+
+    def test_download_file_resume_http(self):
+        """Test resuming an interrupted plain http download from a real server."""
+        content = os.urandom(3 * 1024 * 1024 + 7)
+        url = self._serve(content)
+
+        # Each partial download, its validator, and the expected number of bytes requested
+        cases = [
+            ("unchanged", content[:1000], '"v1"', len(content) - 1000),
+            ("no validator", content[:1000], None, len(content)),
+            ("changed", b"x" * 1000, '"v0"', len(content)),
+            ("complete", content, '"v1"', 0),
+            ("oversized", content + b"x", '"v1"', len(content)),
+        ]
+        for name, partial, validator, expected_received in cases:
+            with self.subTest(name):
+                # Create a partial download and its validator
+                destination = os.path.join(self.temp_dir, name, "testfile.zip")
+                os.makedirs(os.path.dirname(destination))
+                with open(destination + ".part", "wb") as f:
+                    f.write(partial)
+                if validator:
+                    with open(destination + ".part.validator", "w") as f:
+                        f.write(validator)
+
+                # Test
+                with mock.patch(
+                    "netvelocimeter.utils.binary_manager._copy_response",
+                    wraps=binary_manager._copy_response,
+                ) as mock_copy:
+                    download_file(url, destination)
+
+                # Verify only the needed bytes were received and the file is intact
+                received = sum(
+                    int(call.args[0].headers["Content-Length"]) for call in mock_copy.call_args_list
+                )
+                self.assertEqual(received, expected_received)
+                self.assertFalse(os.path.exists(destination + ".part"))
+                self.assertFalse(os.path.exists(destination + ".part.validator"))
+                with open(destination, "rb") as f:
+                    self.assertEqual(f.read(), content)
+
+    @mock.patch("urllib.request.urlopen")
+    def test_download_file_resume_wrong_range(self, mock_urlopen):
+        """Test restarting an interrupted download when the server sends another range."""
+        # Setup mock with a server that sends the wrong range, then the whole file
+        wrong_range = mock.MagicMock()
+        wrong_range.status = 206
+        wrong_range.headers = {"Content-Range": "bytes 0-16/17"}
+        whole_file = mock.MagicMock()
+        whole_file.status = 200
+        whole_file.headers = {}
+        whole_file.read.side_effect = BytesIO(b"test file content").read
+        mock_urlopen.return_value.__enter__.side_effect = [wrong_range, whole_file]
+
+        # Create a partial download and its validator
+        url = "https://example.com/testfile.zip"
+        destination = os.path.join(self.temp_dir, "testfile.zip")
+        with open(destination + ".part", "wb") as f:
+            f.write(b"test file")
+        with open(destination + ".part.validator", "w") as f:
+            f.write('"v1"')
+
+        # Test
+        download_file(url, destination)
+
+        # Verify the wrong range was discarded and the download restarted
+        wrong_range.read.assert_not_called()
+        self.assertEqual(mock_urlopen.call_count, 2)
+        self.assertFalse(mock_urlopen.call_args.args[0].has_header("Range"))
         with open(destination, "rb") as f:
             self.assertEqual(f.read(), b"test file content")
 
@@ -79,24 +406,21 @@ class TestBinaryManagerFunctions(unittest.TestCase):
         self.assertFalse(os.path.exists(destination))
 
     @mock.patch("urllib.request.urlopen")
-    @mock.patch("builtins.open")
-    def test_download_file_no_saved_file(self, mock_open, mock_urlopen):
+    @mock.patch("os.replace")
+    def test_download_file_no_saved_file(self, mock_replace, mock_urlopen):
         """Test that RuntimeError is raised when file doesn't exist after download."""
         # Setup mock response
         mock_response = mock.MagicMock()
-        mock_response.read.return_value = b"test data"
+        mock_response.headers = {}
+        mock_response.read.side_effect = BytesIO(b"test data").read
         mock_urlopen.return_value.__enter__.return_value = mock_response
 
-        # Setup mock file object that doesn't actually write anything
-        mock_file = mock.MagicMock()
-        mock_open.return_value.__enter__.return_value = mock_file
-
         # Test URL and destination path
         url = "https://example.com/test.zip"
-        dest_filepath = "/tmp/test.zip"
+        dest_filepath = os.path.join(self.temp_dir, "test.zip")
 
-        # We don't need to mock os.path.exists because the file won't actually
-        # be created since we're mocking the open function
+        # Mocking os.replace leaves the download in the .part file and
+        # the destination file is never created
 
         # Assert that RuntimeError is raised with the expected message
         with self.assertRaises(RuntimeError) as cm:
@@ -106,16 +430,14 @@ class TestBinaryManagerFunctions(unittest.TestCase):
         self.assertIn(f"Failed to download {url}", str(cm.exception))
 
         # Verify that urlopen was called with the correct URL
-        mock_urlopen.assert_called_once_with(url)
+        mock_urlopen.assert_called_once()
+        self.assertEqual(mock_urlopen.call_args.args[0].full_url, url)
 
-        # Verify that open was called with the correct filepath and mode
-        mock_open.assert_called_once()
-        args, kwargs = mock_open.call_args
-        self.assertEqual(args[0], os.path.abspath(dest_filepath))
-        self.assertEqual(kwargs.get("mode", args[1] if len(args) > 1 else None), "wb")
-
-        # Verify that write was called with the correct data
-        mock_file.write.assert_called_once_with(b"test data")
+        # Verify that the data was written to the partial file then moved to the destination
+        partial_filepath = os.path.abspath(dest_filepath) + ".part"
+        mock_replace.assert_called_once_with(partial_filepath, os.path.abspath(dest_filepath))
+        with open(partial_filepath, "rb") as f:
+            self.assertEqual(f.read(), b"test data")
 
     @pytest.mark.skipif(platform.system() == "Windows", reason="Not applicable on Windows")
     def test_ensure_executable_posix(self):
@@ -137,6 +459,22 @@ class TestBinaryManagerFunctions(unittest.TestCase):
         # Check if executable bit is set
         mode = os.stat(test_file).st_mode
         self.assertTrue(mode & stat.S_IXUSR)  # Check user executable bit
+        self.assertEqual(stat.S_IMODE(mode), 0o750)
+
+    @pytest.mark.skipif(platform.system() == "Windows", reason="Not applicable on Windows")
+    def test_ensure_executable_preserve_mode(self):
+        """Test making a file executable while preserving its existing mode."""
+        # Create a test file
+        test_file = os.path.join(self.temp_dir, "testfile.sh")
+        with open(test_file, "w") as f:
+            f.write("magicexe")
+        os.chmod(test_file, 0o644)  # rw-r--r--
+
+        # Ensure file is executable, keeping the other bits
+        ensure_executable(test_file, preserve_mode=True)
+
+        # Check only the user executable bit was added
+        self.assertEqual(stat.S_IMODE(os.stat(test_file).st_mode), 0o744)
 
     @pytest.mark.skipif(platform.system() != "Windows", reason="Windows-specific test")
     def test_ensure_executable_windows(self):
@@ -659,13 +997,35 @@ class TestBinaryManagerCaching(unittest.TestCase):
         result = self.manager._retrieve_from_cache(self.test_url, "cached.txt")
         self.assertEqual(result, cached_file)
 
+    def test_retrieve_from_cache_removed(self):
+        """Test _retrieve_from_cache when a previously cached file was removed."""
+        # Create a file in the cache and retrieve it
+        cache_dir = self.manager._cache_dir_for_url(self.test_url)
+        cached_file = os.path.join(cache_dir, "cached.txt")
+        with open(cached_file, "w") as f:
+            f.write("cached content")
+        self.assertEqual(
+            self.manager._retrieve_from_cache(self.test_url, "cached.txt"), cached_file
+        )
+
+        # Remove the file, e.g. by another process, then retrieve it again
+        os.remove(cached_file)
+        self.assertIsNone(self.manager._retrieve_from_cache(self.test_url, "cached.txt"))
+
+    @staticmethod
+    def _fake_download(url, dest_filepath):
+        """Create an empty archive in place of downloading it."""
+        os.makedirs(os.path.dirname(dest_filepath), exist_ok=True)
+        open(dest_filepath, "wb").close()
+        return dest_filepath
+
     @mock.patch("netvelocimeter.utils.binary_manager.ensure_executable")
     @mock.patch("netvelocimeter.utils.binary_manager.download_file")
     @mock.patch("netvelocimeter.utils.binary_manager.extract_file")
     def test_download_extract_with_caching(self, mock_extract, mock_download, mock_ensure):
         """Test download_extract with caching."""
         # Set up mocks
-        mock_download.return_value = "/path/to/downloaded.zip"
+        mock_download.side_effect = self._fake_download
         mock_extract.return_value = "/path/to/extracted.txt"
         mock_ensure.return_value = "/path/to/extracted.txt"
 
@@ -697,7 +1057,7 @@ class TestBinaryManagerCaching(unittest.TestCase):
     def test_download_extract_force_download(self, mock_extract, mock_download, mock_ensure):
         """Test download_extract with forced download (dest_dir provided)."""
         # Set up mocks
-        mock_download.return_value = "/path/to/downloaded.zip"
+        mock_download.side_effect = self._fake_download
         mock_extract.return_value = "/path/to/extracted.txt"
         mock_ensure.return_value = "/path/to/extracted.txt"
 
@@ -715,6 +1075,14 @@ class TestBinaryManagerCaching(unittest.TestCase):
         _, kwargs = mock_extract.call_args
         self.assertEqual(kwargs.get("dest_dir"), self.extract_dir)
 
+        # Verify the archive was downloaded outside the cache, then removed
+        archive_filepath = mock_download.call_args.kwargs["dest_filepath"]
+        self.assertFalse(archive_filepath.startswith(self.cache_dir))
+        self.assertFalse(os.path.exists(archive_filepath))
+        self.assertFalse(
+            os.path.exists(self.manager._cache_dir_for_url(self.test_url, create=False))
+        )
+
     @mock.patch("urllib.request.urlopen")
     def test_full_download_extract_cache_flow(self, mock_urlopen):
         """Test the full flow of download, extract, and caching."""
@@ -724,8 +1092,9 @@ class TestBinaryManagerCaching(unittest.TestCase):
 
         # Mock the URL response
         mock_response = mock.MagicMock()
+        mock_response.headers = {}
         with open(archive_path, "rb") as f:
-            mock_response.read.return_value = f.read()
+            mock_response.read.side_effect = BytesIO(f.read()).read
         mock_urlopen.return_value.__enter__.return_value = mock_response
 
         # First call - should download, extract, and cache
@@ -746,6 +1115,47 @@ class TestBinaryManagerCaching(unittest.TestCase):
         self.assertEqual(result1, result2)
         mock_urlopen.assert_not_called()
 
+    @mock.patch("urllib.request.urlopen")
+    def test_download_extract_concurrent(self, mock_urlopen):
+        """Test concurrent download_extract calls for the same URL share one download."""
+        archive_path = self.create_test_archive(os.path.join(self.download_dir, "test.zip"))
+        with open(archive_path, "rb") as f:
+            archive = f.read()
+
+        # Fake server which is slow to respond, so both calls overlap
+        def fake_urlopen(request):
+            time.sleep(0.2)
+            response = mock.MagicMock()
+            response.headers = {}
+            response.read.side_effect = BytesIO(archive).read
+            cm = mock.MagicMock()
+            cm.__enter__.return_value = response
+            return cm
+
+        mock_urlopen.side_effect = fake_urlopen
+
+        # Test with a manager per caller, as in separate processes
+        barrier = threading.Barrier(2)
+
+        def download_extract():
+            manager = BinaryManager(MockProvider, self.cache_dir)
+            barrier.wait()
+            return manager.download_extract(self.test_url, self.internal_file)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(download_extract) for _ in range(2)]
+            results = [future.result() for future in futures]
+
+        # Verify both calls return the extracted file, which was downloaded once
+        self.assertEqual(results[0], results[1])
+        mock_urlopen.assert_called_once()
+        with open(results[0]) as f:
+            self.assertEqual(f.read(), self.file_content)
+
+        # Verify the archive was downloaded within the URL's cache directory, then removed
+        download_dir = os.path.join(self.manager._cache_dir_for_url(self.test_url), ".download")
+        self.assertEqual(os.listdir(download_dir), ["test.zip.lock"])
+
     def test_invalid_provider_class(self):
         """Test initialization with invalid provider class."""
         # Try with a class that's not a BaseProvider subclass
@@ -765,7 +1175,7 @@ class TestBinaryManagerCaching(unittest.TestCase):
             mock.patch("netvelocimeter.utils.binary_manager.extract_file") as mock_extract,
             mock.patch("netvelocimeter.utils.binary_manager.ensure_executable") as mock_ensure,
         ):
-            mock_download.return_value = "/path/to/downloaded.zip"
+            mock_download.side_effect = self._fake_download
             mock_extract.return_value = "/path/to/extracted.txt"
             mock_ensure.return_value = "/path/to/extracted.txt"
             self.manager.download_extract(self.test_url, self.internal_file)
@@ -776,7 +1186,7 @@ class TestBinaryManagerCaching(unittest.TestCase):
             platform.system(),
             platform.machine(),
             MockProvider.__name__.lower(),
-            hash_b64encode(self.test_url),
+            hash_b64encode(self.test_url, algorithm="blake2b"),
         ]
 
         # Get the URL hash directory
@@ -803,7 +1213,7 @@ class TestBinaryManagerCaching(unittest.TestCase):
     def test_filename_verification(self, mock_download, mock_extract):
         """Test filename verification in download_extract."""
         # Set up mocks
-        mock_download.return_value = "/path/to/downloaded.zip"
+        mock_download.side_effect = self._fake_download
         mock_extract.return_value = "/path/to/extracted.txt"
 
         # Test with invalid internal filepath
@@ -1,10 +1,15 @@
 """Tests for formatters module using unittest methodology."""
 
 from dataclasses import dataclass
+from enum import Enum
 import unittest
 
 from netvelocimeter.cli.utils.formatters import escape_whitespace
-from netvelocimeter.utils.formatters import _flatten_fields, pretty_print_two_columns
+from netvelocimeter.utils.formatters import (
+    _FIELD_NAMES_CACHE,
+    _flatten_fields,
+    pretty_print_two_columns,
+)
 
 
 @dataclass
@@ -119,6 +124,15 @@ class TestFormattersFlattenFields(unittest.TestCase):
         self.assertTrue(expected_labels == actual_labels)
         self.assertGreaterEqual(width, 6)
 
+    def test_flatten_deep_nested_order(self):
+        """Test nested fields are flattened in place, keeping display order."""
+        obj = DeepNested(outer=Nested(x=1, y=Simple(a=2, bb="b")), value=99)
+        fields, width = _flatten_fields(obj)
+        self.assertEqual(
+            fields, [("x:", 1), ("a:", 2), ("bb:", "b"), ("z:", "zzz"), ("value:", 99)]
+        )
+        self.assertEqual(width, 6)
+
     def test_flatten_with_prefix(self):
         """Test flattening with a prefix for field names."""
         obj = Simple(a=5, bb="test")
@@ -141,6 +155,19 @@ class TestFormattersFlattenFields(unittest.TestCase):
         self.assertEqual(fields, [("a:", 1)])
         self.assertEqual(width, 2)
 
+    def test_flatten_enum_not_nested(self):
+        """Test enum values are kept as values and not flattened."""
+
+        class Color(Enum):
+            RED = "red"
+
+        @dataclass
+        class WithEnum:
+            color: Color
+
+        fields, _ = _flatten_fields(WithEnum(color=Color.RED))
+        self.assertEqual(fields, [("color:", Color.RED)])
+
     def test_flatten_with_format_prefix(self):
         """Test flattening uses _format_prefix attribute for nested dataclasses."""
 
@@ -164,6 +191,29 @@ class TestFormattersFlattenFields(unittest.TestCase):
         self.assertIn(("x:", 10), fields)
         self.assertGreaterEqual(width, 5)
 
+    def test_flatten_caches_dataclass_fields(self):
+        """Test field names of dataclass types are cached."""
+        _flatten_fields(Simple(a=1, bb="foo"))
+        self.assertEqual(_FIELD_NAMES_CACHE[Simple], ("a", "bb"))
+
+        # Cached names are reused for other instances
+        fields, _ = _flatten_fields(Simple(a=2, bb="bar"))
+        self.assertEqual(fields, [("a:", 2), ("bb:", "bar")])
+
+    def test_flatten_plain_class_instances_differ(self):
+        """Test instance attributes of plain classes are read per instance."""
+
+        class Plain:
+            pass
+
+        first = Plain()
+        first.a = 1
+        second = Plain()
+        second.b = 2
+        self.assertEqual(_flatten_fields(first)[0], [("a:", 1)])
+        self.assertEqual(_flatten_fields(second)[0], [("b:", 2)])
+        self.assertNotIn(Plain, _FIELD_NAMES_CACHE)
+
 
 class TestFormattersPrettyPrintTwoColumns(unittest.TestCase):
     """Test cases for pretty_print_two_columns function."""
@@ -207,6 +257,25 @@ class TestFormattersPrettyPrintTwoColumns(unittest.TestCase):
         self.assertEqual("   line2", lines[1])
         self.assertEqual("   line3", lines[2])
 
+    def test_pretty_print_long_label(self):
+        """Test labels wider than the label column are on their own line."""
+
+        @dataclass
+        class LongLabel:
+            a: int = 1
+            a_very_long_field_name_which_is_wider_than_the_label_column: str = "long"
+
+        result = pretty_print_two_columns(LongLabel(), "")
+        indent = " " * 49
+        self.assertEqual(
+            result,
+            "a:".ljust(48)
+            + " 1\n"
+            + "a_very_long_field_name_which_is_wider_than_the_label_column:\n"
+            + indent
+            + "long",
+        )
+
     def test_pretty_print_empty_object(self):
         """Test pretty printing an empty object."""
 
@@ -1,7 +1,7 @@
 """Tests for hash utility functions."""
 
 from base64 import urlsafe_b64encode
-from hashlib import sha256
+from hashlib import blake2b, sha256
 import unittest
 
 from netvelocimeter.utils.hash import hash_b64encode
@@ -23,7 +23,7 @@ class TestHashFunctions(unittest.TestCase):
         # Verify the result matches the expected hash of "test"
         # First calculate the expected hash manually
         data = "test"
-        data_hash = sha256(data.encode("utf-8")).digest()
+        data_hash = blake2b(data.encode("utf-8"), digest_size=16).digest()
         expected = urlsafe_b64encode(data_hash).decode("ascii").rstrip("=")[:22]
         self.assertEqual(result, expected)
 
@@ -32,7 +32,7 @@ class TestHashFunctions(unittest.TestCase):
         result = hash_b64encode(b"test")
 
         # Calculate expected result
-        data_hash = sha256(b"test").digest()
+        data_hash = blake2b(b"test", digest_size=16).digest()
         expected = urlsafe_b64encode(data_hash).decode("ascii").rstrip("=")[:22]
         self.assertEqual(result, expected)
 
@@ -63,7 +63,7 @@ class TestHashFunctions(unittest.TestCase):
         """Test hashing an empty string."""
         result = hash_b64encode("")
         # Calculate expected result
-        data_hash = sha256(b"").digest()
+        data_hash = blake2b(b"", digest_size=16).digest()
         expected = urlsafe_b64encode(data_hash).decode("ascii").rstrip("=")[:22]
         self.assertEqual(result, expected)
 
@@ -71,7 +71,7 @@ class TestHashFunctions(unittest.TestCase):
         """Test hashing empty bytes."""
         result = hash_b64encode(b"")
         # Calculate expected result
-        data_hash = sha256(b"").digest()
+        data_hash = blake2b(b"", digest_size=16).digest()
         expected = urlsafe_b64encode(data_hash).decode("ascii").rstrip("=")[:22]
         self.assertEqual(result, expected)
 
@@ -87,7 +87,7 @@ class TestHashFunctions(unittest.TestCase):
         special_chars = "!@#$%^&*()_+-=[]{}|;':\",./<>?"
         result = hash_b64encode(special_chars)
         # Calculate expected result
-        data_hash = sha256(special_chars.encode("utf-8")).digest()
+        data_hash = blake2b(special_chars.encode("utf-8"), digest_size=16).digest()
         expected = urlsafe_b64encode(data_hash).decode("ascii").rstrip("=")[:22]
         self.assertEqual(result, expected)
 
@@ -116,6 +116,49 @@ class TestHashFunctions(unittest.TestCase):
         for unicode_str in unicode_strings:
             result = hash_b64encode(unicode_str)
             # Verify result is correct
-            data_hash = sha256(unicode_str.encode("utf-8")).digest()
+            data_hash = blake2b(unicode_str.encode("utf-8"), digest_size=16).digest()
             expected = urlsafe_b64encode(data_hash).decode("ascii").rstrip("=")[:22]
             self.assertEqual(result, expected)
+
+    def test_hash_b64encode_sha256(self):
+        """Test hashing with the sha256 algorithm."""
+        result = hash_b64encode("test", algorithm="sha256")
+        data_hash = sha256(b"test").digest()
+        expected = urlsafe_b64encode(data_hash).decode("ascii").rstrip("=")[:22]
+        self.assertEqual(result, expected)
+        self.assertNotEqual(result, hash_b64encode("test", algorithm="blake2b"))
+
+    def test_hash_b64encode_full_hash(self):
+        """Test the full hash is returned when not truncated."""
+        self.assertEqual(hash_b64encode("test", truncate=None), hash_b64encode("test"))
+        self.assertEqual(len(hash_b64encode("test", truncate=None, algorithm="sha256")), 43)
+
+    def test_hash_b64encode_truncate_lengths(self):
+        """Test truncation never includes base64 padding."""
+        for algorithm, full_length in (("blake2b", 22), ("sha256", 43)):
+            full_hash = hash_b64encode("test", truncate=None, algorithm=algorithm)
+            self.assertEqual(len(full_hash), full_length)
+            for truncate in (0, 1, full_length - 1, full_length, full_length + 1, 100, -1):
+                with self.subTest(algorithm=algorithm, truncate=truncate):
+                    self.assertEqual(
+                        hash_b64encode("test", truncate=truncate, algorithm=algorithm),
+                        full_hash[:truncate],
+                    )
+
+    def test_hash_b64encode_cached(self):
+        """Test repeated identifiers are served from the cache."""
+        hash_b64encode.cache_clear()
+        first = hash_b64encode("test")
+        second = hash_b64encode(b"test")
+        self.assertEqual(first, second)
+        self.assertEqual(hash_b64encode.cache_info().hits, 1)
+
+        # Different truncation and algorithms are cached separately
+        self.assertEqual(hash_b64encode("test", truncate=8), first[:8])
+        self.assertNotEqual(hash_b64encode("test", algorithm="sha256"), first)
+        self.assertEqual(hash_b64encode.cache_info().hits, 1)
+
+    def test_hash_b64encode_invalid_algorithm(self):
+        """Test hashing with an unsupported algorithm."""
+        with self.assertRaises(ValueError):
+            hash_b64encode("test", algorithm="md5")
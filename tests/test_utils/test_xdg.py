@@ -156,8 +156,8 @@ class TestXDGSystemPaths(unittest.TestCase):
         self.assertEqual(self.system_paths.windows, self.windows_path)
         self.assertEqual(self.system_paths.posix, self.posix_path)
 
-    @mock.patch("platform.system", return_value="Windows")
-    def test_resolve_path_windows(self, mock_system):
+    @mock.patch("netvelocimeter.utils.xdg._IS_WINDOWS", True)
+    def test_resolve_path_windows(self):
         """Test resolving path on Windows platform."""
         # Create a real XDGSystemPaths object with test paths
         windows_path = XDGPath(default="C:\\test\\windows\\path")
@@ -167,12 +167,12 @@ class TestXDGSystemPaths(unittest.TestCase):
         # Call the method under test
         result = system_paths.resolve_path()
 
-        # We should get the Windows path since we mocked platform.system() to return "Windows"
+        # We should get the Windows path since we mocked the platform to be Windows
         # This tests actual behavior, not implementation details
         self.assertEqual(result, "C:\\test\\windows\\path")
 
-    @mock.patch("platform.system", return_value="Linux")
-    def test_resolve_path_posix(self, mock_system):
+    @mock.patch("netvelocimeter.utils.xdg._IS_WINDOWS", False)
+    def test_resolve_path_posix(self):
         """Test resolving path on POSIX platform."""
         # Create a real XDGSystemPaths object with test paths
         windows_path = XDGPath(default="C:\\test\\windows\\path")
@@ -182,7 +182,7 @@ class TestXDGSystemPaths(unittest.TestCase):
         # Call the method under test
         result = system_paths.resolve_path()
 
-        # We should get the POSIX path since we mocked platform.system() to return "Linux"
+        # We should get the POSIX path since we mocked the platform to be POSIX
         # This tests actual behavior, not implementation details
         self.assertEqual(result, "/test/posix/path")
 
@@ -256,6 +256,18 @@ class TestXDGCategory(unittest.TestCase):
         expected = os.path.normpath("/base/path/app/data")
         self.assertEqual(result, expected)
 
+    @mock.patch("netvelocimeter.utils.xdg._IS_WINDOWS", False)
+    def test_resolve_path_follows_environment(self):
+        """Test each resolution uses the current environment variables."""
+        with mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": "/first/config"}):
+            self.assertEqual(
+                XDGCategory.CONFIG.resolve_path("app"), os.path.join("/first/config", "app")
+            )
+        with mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": "/second/config"}):
+            self.assertEqual(
+                XDGCategory.CONFIG.resolve_path("app"), os.path.join("/second/config", "app")
+            )
+
 
 class TestXDGIntegration(unittest.TestCase):
     """Integration tests for the XDG module."""